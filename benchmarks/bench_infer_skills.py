@@ -0,0 +1,74 @@
+"""Microbenchmark: SkillMatcher vs the per-keyword scan infer_skills used before it.
+
+Builds synthetic README text of a few sizes, checks both implementations agree,
+then reports the best-of-N time for each.
+
+    python3 benchmarks/bench_infer_skills.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import portfolio_builder as pb  # noqa: E402
+
+
+def legacy_infer_skills(project_name: str, readme_text: str) -> list[str]:
+    corpus = re.sub(r"\s+", " ", f"{project_name} {readme_text}".lower())
+
+    def has_keyword(keyword: str) -> bool:
+        token = keyword.lower().strip()
+        if not token:
+            return False
+        if any(separator in token for separator in (" ", ".", "/", "+", "-")):
+            return token in corpus
+        return re.search(rf"(?<![a-z0-9]){re.escape(token)}(?![a-z0-9])", corpus) is not None
+
+    skills = [skill for skill, keywords in pb.SKILL_RULES if any(has_keyword(keyword) for keyword in keywords)]
+    return (skills or ["Backend", "AI"])[:6]
+
+
+def synthetic_readme(size: int, seed: int) -> str:
+    rng = random.Random(seed)
+    filler = "the a of system data using build layer module service lorem ipsum dolor amet".split()
+    keywords = ["python", "docker", "react", "api", "aws", "full stack", "machine learning"]
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(keywords) if rng.random() < 0.01 else rng.choice(filler)
+        words.append(word + ("\n" if rng.random() < 0.08 else " "))
+        length += len(words[-1])
+    return "".join(words)
+
+
+def best_of(repeat: int, func, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'readme size':>12}  {'legacy ms':>10}  {'matcher ms':>10}  {'speedup':>8}")
+    for size in (2_000, 50_000, 1_000_000):
+        text = synthetic_readme(size, seed=size)
+        assert pb.infer_skills("bench", text) == legacy_infer_skills("bench", text)
+        legacy = best_of(args.repeat, legacy_infer_skills, "bench", text)
+        current = best_of(args.repeat, pb.infer_skills, "bench", text)
+        print(f"{size:>12,}  {legacy * 1000:>10.2f}  {current * 1000:>10.2f}  {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
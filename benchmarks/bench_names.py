@@ -0,0 +1,114 @@
+"""Microbenchmark: memoized name helpers vs the uncached regex versions.
+
+Builds 10k checkout-style names, then replays them the way one build does
+(load_config, the scan loop, resolve_repo_link, ranking and deduplication each
+look the same names up again) through both implementations.
+
+    python3 benchmarks/bench_names.py [--names 10000] [--passes 6] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import portfolio_builder as pb  # noqa: E402
+
+
+def legacy_normalize_name(value: str) -> str:
+    normalized = re.sub(r"[^a-z0-9]+", "-", value.strip().lower())
+    normalized = re.sub(r"-+", "-", normalized).strip("-")
+    return normalized
+
+
+def legacy_canonical_name_key(name: str) -> str:
+    normalized = legacy_normalize_name(name)
+    normalized = re.sub(r"(?:-|_)?backup(?:-|_)?\d.*$", "", normalized)
+    normalized = re.sub(r"(?:-|_)?\d{8,}$", "", normalized)
+    normalized = re.sub(r"(?:-|_)?(copy|old)$", "", normalized)
+    normalized = re.sub(r"-+", "-", normalized).strip("-")
+    return normalized
+
+
+def legacy_is_backup_like_name(name: str) -> bool:
+    normalized = legacy_normalize_name(name)
+    return bool(re.search(r"(?:^|-)(backup|copy|old)(?:-|$)", normalized))
+
+
+def synthetic_names(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    stems = ["EduMind AI", "portfolio_site", "rag-pipeline", "Vision Toolkit", "llm.agents", "infra"]
+    suffixes = ["", "", "", "-backup-2", "_copy", " old", "-20240131"]
+    return [f"{rng.choice(stems)} {index}{rng.choice(suffixes)}" for index in range(count)]
+
+
+def replay(names: list[str], passes: int, normalize, canonical, backup_like) -> None:
+    for _ in range(passes):
+        for name in names:
+            normalize(name)
+            canonical(name)
+            backup_like(name)
+
+
+def best_of(repeat: int, setup, func, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        setup()
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def clear_caches() -> None:
+    for helper in (pb.normalize_name, pb.canonical_name_key, pb.is_backup_like_name):
+        helper.cache_clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=10_000)
+    parser.add_argument("--passes", type=int, default=6, help="Times each name is looked up, as in one build")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = synthetic_names(args.names, seed=args.names)
+    for name in names:
+        assert pb.normalize_name(name) == legacy_normalize_name(name)
+        assert pb.canonical_name_key(name) == legacy_canonical_name_key(name)
+        assert pb.is_backup_like_name(name) == legacy_is_backup_like_name(name)
+
+    legacy = best_of(
+        args.repeat,
+        lambda: None,
+        replay,
+        names,
+        args.passes,
+        legacy_normalize_name,
+        legacy_canonical_name_key,
+        legacy_is_backup_like_name,
+    )
+    current = best_of(
+        args.repeat,
+        clear_caches,
+        replay,
+        names,
+        args.passes,
+        pb.normalize_name,
+        pb.canonical_name_key,
+        pb.is_backup_like_name,
+    )
+    info = pb.normalize_name.cache_info()
+    print(f"{args.names:,} names x {args.passes} passes")
+    print(f"  uncached regexes  {legacy * 1000:>9.1f} ms")
+    print(f"  memoized helpers  {current * 1000:>9.1f} ms  ({legacy / current:.1f}x)")
+    print(f"  normalize_name cache: {info.hits:,} hits, {info.misses:,} misses, {info.currsize:,}/{info.maxsize:,} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""End-to-end benchmark of portfolio_builder, timed stage by stage.
+
+Generates synthetic checkout trees (10, 1k and 10k repos by default) whose
+READMEs range from a couple of lines to a few hundred KiB, serves GitHub from
+a local FakeGitHub with configurable latency, and runs the real
+collect_projects + write_output against it, reporting the per-stage times
+BuildStats records (revisions without BuildStats report collect_projects as a
+single stage). Results are written as JSON so two commits can be compared:
+
+    python3 benchmarks/bench_pipeline.py --output before.json
+    git checkout other-commit
+    python3 benchmarks/bench_pipeline.py --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import inspect
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+import portfolio_builder as pb  # noqa: E402
+from fake_github import FakeGitHub  # noqa: E402
+
+OWNER = "bench"
+# Stage names BuildStats records, in pipeline order; anything else is listed after them.
+STAGES = (
+    "scan",
+    "readmes",
+    "preferred",
+    "owned_prefetch",
+    "ownership",
+    "owned_listing",
+    "dedup",
+    "rank",
+    "collect_projects",
+    "write_output",
+)
+# (weight, approximate README size in bytes): mostly short, a long tail of big ones.
+README_SIZES = ((60, 600), (30, 6_000), (9, 60_000), (1, 400_000))
+FILLER = "the a of system data using build layer module service pipeline request cache".split()
+KEYWORDS = ["python", "docker", "react", "api", "aws", "full stack", "machine learning", "fastapi", "kubernetes"]
+
+
+def synthetic_readme(rng: random.Random, size: int) -> str:
+    lines = [f"# Project {rng.randrange(10_000)}", "", "![badge](https://img.shields.io/badge/x-y-green)", ""]
+    length = 0
+    while length < size:
+        words = [rng.choice(KEYWORDS) if rng.random() < 0.02 else rng.choice(FILLER) for _ in range(rng.randint(6, 18))]
+        line = " ".join(words).capitalize() + "."
+        if rng.random() < 0.03:
+            line = f"```bash\npip install {rng.choice(FILLER)}\n```"
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def build_tree(base: Path, repos: int, seed: int, linked_fraction: float, jobs: int) -> tuple[Path, pb.BuilderConfig, int]:
+    """Write `repos` checkouts next to a site root; returns (root, config, README bytes)."""
+    rng = random.Random(seed)
+    checkouts = base / "checkouts"
+    checkouts.mkdir()
+    root = base / "site"
+    root.mkdir()
+    weights = [weight for weight, _ in README_SIZES]
+    sizes = [size for _, size in README_SIZES]
+    project_github: dict[str, str] = {}
+    total = 0
+    for index in range(repos):
+        # A few backup copies so deduplicate_projects has collisions to resolve.
+        name = f"repo-{index:05d}" if rng.random() > 0.05 else f"repo-{rng.randrange(max(1, index)):05d}-backup"
+        target = checkouts / name
+        if target.exists():
+            name = f"repo-{index:05d}"
+            target = checkouts / name
+        target.mkdir()
+        text = synthetic_readme(rng, rng.choices(sizes, weights)[0])
+        (target / "README.md").write_text(text, encoding="utf-8")
+        total += len(text)
+        if rng.random() < linked_fraction:
+            project_github[name] = f"https://github.com/{OWNER}/{name}"
+
+    settings = dict(
+        scan_paths=["../checkouts"],
+        skip_projects=set(),
+        exclude_projects=set(),
+        github_username=OWNER,
+        project_github=project_github,
+        max_projects=24,
+        preferred_projects=[],
+        github_fallback_limit=repos,
+        network_workers=8,
+        github_graphql=False,
+        jobs=jobs,
+    )
+    # Older revisions lack some of these fields; --compare runs them too.
+    known = {spec.name for spec in dataclasses.fields(pb.BuilderConfig)}
+    cfg = pb.BuilderConfig(**{name: value for name, value in settings.items() if name in known})
+    return root, cfg, total
+
+
+def run_pipeline(root: Path, cfg: pb.BuilderConfig, client: pb.GitHubClient) -> tuple[dict[str, float], float, int]:
+    """Run one build the way main() does; returns (stage timings, wall time, project count)."""
+    stats = pb.BuildStats() if hasattr(pb, "BuildStats") else None
+    extra = {"stats": stats} if stats and "stats" in inspect.signature(pb.collect_projects).parameters else {}
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    projects = pb.collect_projects(root, cfg, client, **extra)
+    timings["collect_projects"] = time.perf_counter() - started
+    pb.write_output(root, projects)
+    wall = time.perf_counter() - started
+    timings["write_output"] = wall - timings["collect_projects"]
+    if extra:
+        timings.update(stats.stages)
+    return timings, wall, len(projects)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def print_table(results: list[dict[str, object]], baseline: dict[int, dict[str, float]]) -> None:
+    header = f"{'stage':<22}" + "".join(f"{str(entry['repos']) + ' repos':>22}" for entry in results)
+    print(header)
+    seen = [stage for entry in results for stage in entry["stages"] if stage not in STAGES]
+    for stage in (*STAGES, *dict.fromkeys(seen), "total"):
+        cells = []
+        for entry in results:
+            seconds = entry["stages"].get(stage) if stage != "total" else entry["total"]
+            if seconds is None:
+                cells.append(f"{'-':>22}")
+                continue
+            cell = f"{seconds * 1000:.1f} ms"
+            before = baseline.get(entry["repos"], {}).get(stage)
+            if before:
+                cell += f" ({before / seconds if seconds else float('inf'):.1f}x)"
+            cells.append(f"{cell:>22}")
+        print(f"{stage:<22}" + "".join(cells))
+
+
+def load_baseline(path: Path) -> dict[int, dict[str, float]]:
+    previous = json.loads(path.read_text(encoding="utf-8"))
+    return {int(entry["repos"]): {**entry["stages"], "total": entry["total"]} for entry in previous["results"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,1000,10000", help="Comma-separated repo counts (default: 10,1000,10000)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay added to every fake GitHub response")
+    parser.add_argument(
+        "--handshake-ms", type=float, default=60.0, help="Delay added to every new connection (TCP + TLS setup)"
+    )
+    parser.add_argument("--linked-fraction", type=float, default=0.1, help="Share of repos with a GitHub link to check")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for analyze_readmes")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per size; the fastest time of each stage is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path")
+    parser.add_argument("--compare", type=Path, help="Earlier --output file to show speedups against")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results: list[dict[str, object]] = []
+    for repos in (int(value) for value in args.sizes.split(",") if value.strip()):
+        with tempfile.TemporaryDirectory(prefix="portfolio-bench-") as tmp:
+            root, cfg, readme_bytes = build_tree(Path(tmp), repos, args.seed + repos, args.linked_fraction, args.jobs)
+            best: dict[str, float] = {}
+            fastest = float("inf")
+            fake = FakeGitHub(latency=args.latency_ms / 1000, owned=repos, handshake=args.handshake_ms / 1000)
+            with fake:
+                for _ in range(max(1, args.repeat)):
+                    client = pb.GitHubClient(api_base=fake.api_base)
+                    timings, wall, written = run_pipeline(root, cfg, client)
+                    client.close()
+                    best = {stage: min(seconds, best.get(stage, seconds)) for stage, seconds in timings.items()}
+                    fastest = min(fastest, wall)
+        results.append(
+            {
+                "repos": repos,
+                "readme_bytes": readme_bytes,
+                "projects": written,
+                "github_requests": fake.request_count // max(1, args.repeat),
+                "github_connections": fake.connections // max(1, args.repeat),
+                "stages": best,
+                "total": fastest,
+            }
+        )
+
+    print_table(results, baseline)
+    report = {
+        "benchmark": "portfolio_builder pipeline",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "latency_ms": args.latency_ms,
+            "handshake_ms": args.handshake_ms,
+            "linked_fraction": args.linked_fraction,
+            "jobs": args.jobs,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
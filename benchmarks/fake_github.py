@@ -0,0 +1,84 @@
+"""Local stand-in for the GitHub REST endpoints portfolio_builder calls.
+
+Every response is delayed by `latency` seconds, and every new connection by
+`handshake` seconds (standing in for the TCP + TLS setup a real HTTPS
+connection costs), so network-bound stages can be timed without touching
+api.github.com. Repos are synthesized on demand:
+
+    GET /repos/{owner}/{name}      -> {"name", "fork", ...}; forks are names whose
+                                      number is divisible by `fork_every`
+    GET /users/{owner}/repos?...   -> `owned` repos, 100 per page, with Link headers
+
+Use as a context manager; `api_base` is what GitHubClient should be pointed at.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import re
+import sys
+import time
+from urllib.parse import parse_qsl, urlparse
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "tests"))
+from stub_server import StubServer, send_json  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def repo_payload(owner: str, name: str, fork_every: int) -> dict[str, object]:
+    number = int(re.sub(r"\D", "", name) or 0)
+    return {
+        "name": name,
+        "fork": fork_every > 0 and number % fork_every == 0,
+        "description": f"Synthetic {name} service with a python api and docker deployment.",
+        "html_url": f"https://github.com/{owner}/{name}",
+        "language": "Python",
+        "topics": ["api", "docker"],
+    }
+
+
+class FakeGitHub(StubServer):
+    keep_alive = True
+
+    def __init__(self, latency: float = 0.0, owned: int = 0, fork_every: int = 7, handshake: float = 0.0) -> None:
+        super().__init__()
+        self.latency = latency
+        self.handshake = handshake
+        self.owned = owned
+        self.fork_every = fork_every
+        self.request_count = 0
+
+    def connected(self) -> None:
+        super().connected()
+        if self.handshake:
+            time.sleep(self.handshake)
+
+    def do_GET(self, handler) -> None:
+        with self._count_lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        status, payload, headers = self.route(handler.path)
+        send_json(handler, status, payload, headers)
+
+    def route(self, path: str) -> tuple[int, object, dict[str, str]]:
+        parsed = urlparse(path)
+        parts = parsed.path.strip("/").split("/")
+        if len(parts) == 3 and parts[0] == "repos":
+            return 200, repo_payload(parts[1], parts[2], self.fork_every), {}
+        if len(parts) == 3 and parts[0] == "users" and parts[2] == "repos":
+            return self._owned_page(parts[1], parsed.path, dict(parse_qsl(parsed.query)))
+        return 404, {"message": "Not Found"}, {}
+
+    def _owned_page(self, owner: str, path: str, query: dict[str, str]) -> tuple[int, object, dict[str, str]]:
+        page = int(query.get("page", "1"))
+        last = max(1, -(-self.owned // PAGE_SIZE))
+        start = (page - 1) * PAGE_SIZE
+        repos = [repo_payload(owner, f"owned-{i:05d}", self.fork_every) for i in range(start, min(start + PAGE_SIZE, self.owned))]
+        links = []
+        base = f"{self.api_base}{path}?type=owner&sort=updated&per_page={PAGE_SIZE}"
+        if page < last:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}&page={last}>; rel="last"')
+        return 200, repos, {"Link": ", ".join(links)} if links else {}
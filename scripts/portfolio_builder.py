@@ -1,16 +1,99 @@
 from __future__ import annotations
 
 import argparse
+import contextvars
+import functools
+import hashlib
+import heapq
+import io
 import json
+import os
 import re
-from dataclasses import dataclass
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
+
+# asyncio, ssl, urllib.request, concurrent.futures and cProfile are imported
+# where they are used: together they are most of the startup time, and a run
+# that stays local (--offline, or no github_username) never needs them.
+if TYPE_CHECKING:
+    import asyncio
+    import ssl
 
 
 README_CANDIDATES = ["README.md", "readme.md", "Readme.md"]
+SKILL_RULES: list[tuple[str, list[str]]] = [
+    ("Full Stack", ["full stack", "end-to-end", "frontend", "backend"]),
+    ("Backend", ["backend", "api", "microservice", "fastapi", "flask", "django", "server"]),
+    ("Frontend", ["frontend", "react", "next.js", "astro", "ui", "web app", "javascript", "typescript"]),
+    ("DevOps", ["docker", "kubernetes", "ci/cd", "github actions", "terraform", "helm", "ansible"]),
+    ("AI", ["ai", "artificial intelligence", "agent", "generative", "inference"]),
+    ("LLMs", ["llm", "gpt", "transformer", "chatbot", "prompt"]),
+    ("RAG", ["rag", "retrieval augmented", "vector database", "embedding", "semantic search"]),
+    ("Python", ["python", "pytorch", "tensorflow", "numpy", "pandas"]),
+    ("Machine Learning", ["machine learning", "ml", "classification", "regression"]),
+    ("Deep Learning", ["deep learning", "neural", "transformer", "lstm"]),
+    ("NLP", ["nlp", "language model", "llm", "bert", "gpt"]),
+    ("Computer Vision", ["opencv", "vision", "image", "object detection"]),
+    ("AWS", ["aws", "ec2", "s3", "lambda", "autoscaling"]),
+    ("Java", ["java", "spring"]),
+]
+# Keywords containing one of these match as substrings; the rest need word boundaries.
+SKILL_SEPARATORS = (" ", ".", "/", "+", "-")
+_ALNUM = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Bump whenever summarize_readme / infer_skills change what they derive, so
+# README manifests written by an older builder are discarded.
+BUILDER_VERSION = "2"
+MANIFEST_NAME = "projects.manifest.json"
+README_FENCE = "```"
+# READMEs are fed to the skill scanner in blocks of about this many characters.
+SKILL_SCAN_BLOCK = 64 * 1024
+# Entries kept by each memoized name helper. A build looks each name up several
+# times, so this should hold every name of a large tree (LRU thrashes otherwise).
+NAME_CACHE_SIZE = 16384
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_BACKUP_SUFFIX_RE = re.compile(r"-?backup-?\d.*$")
+_TIMESTAMP_SUFFIX_RE = re.compile(r"-?\d{8,}$")
+_COPY_SUFFIX_RE = re.compile(r"-?(copy|old)$")
+_BACKUP_WORD_RE = re.compile(r"(?:^|-)(backup|copy|old)(?:-|$)")
+_GIT_REMOTE_SECTION_RE = re.compile(r'^\[\s*remote\s+"([^"]+)"\s*\]')
+# scp-style remotes: [user@]host:path, e.g. git@github.com:owner/repo.git
+_SCP_REMOTE_RE = re.compile(r"^(?:[^@/:]+@)?([^/:]+):(?!//)(.+)$")
+# --watch: seconds between checks without inotify, and how long changes must
+# settle before a rebuild starts (an editor save is often several writes).
+WATCH_INTERVAL = 1.0
+WATCH_DEBOUNCE = 0.3
+# Guards ownership_cache when is_original_repo runs on several worker threads.
+_OWNERSHIP_CACHE_LOCK = threading.Lock()
+# The network stage the current thread is serving, so a lookup the --deadline
+# budget skips is charged to it even while other stages run alongside.
+_NETWORK_STAGE: contextvars.ContextVar[str | None] = contextvars.ContextVar("network_stage", default=None)
+GITHUB_API = "https://api.github.com"
+CACHE_DIR = Path(".cache") / "portfolio-builder"
+# Response headers kept with each cached payload: the validators used for
+# conditional requests plus Link, which pagination needs.
+CACHED_HEADERS = ("etag", "last-modified", "link")
+# Statuses that are a definitive answer about the resource rather than a failure.
+GITHUB_NOT_FOUND = (404, 410)
+# Redirects followed per GET (GitHub answers renamed repos with a 301).
+MAX_REDIRECTS = 5
+# Repos per aliased GraphQL query; GitHub caps a query's node count, 50 stays well inside it.
+GRAPHQL_BATCH_SIZE = 50
+GRAPHQL_REPO_FIELDS = (
+    "name isFork description url primaryLanguage { name } "
+    "repositoryTopics(first: 20) { nodes { topic { name } } }"
+)
+# Skills that earn a project extra ranking weight.
+PRIORITY_TAGS = frozenset({"AI", "LLMs", "RAG", "Backend", "DevOps", "Computer Vision", "Full Stack"})
 NOISE_SECTION_PREFIXES = {
     "installation",
     "usage",
@@ -33,12 +116,109 @@ class BuilderConfig:
     max_projects: int
     preferred_projects: list[str]
     github_fallback_limit: int
-
-
+    network_workers: int = 8
+    cache_ttl_seconds: int = 6 * 60 * 60
+    github_graphql: bool = True
+    jobs: int = 1
+    rate_limit_max_wait: float = 60.0
+    # Lowercased "owner/repo" refs that are forks, answered without a lookup.
+    known_forks: set[str] = field(default_factory=set)
+    # Answer fork checks from one /users/{github_username}/repos listing.
+    prefetch_owned_repos: bool = True
+    # normalize_name(key) -> link, built once from project_github; when keys
+    # collide the first one wins and all of them are listed in the collisions.
+    project_github_index: dict[str, str] = field(init=False, repr=False, compare=False)
+    project_github_collisions: dict[str, list[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.project_github_index = {}
+        keys_by_name: dict[str, list[str]] = {}
+        for key, value in self.project_github.items():
+            normalized = normalize_name(str(key))
+            keys_by_name.setdefault(normalized, []).append(str(key))
+            self.project_github_index.setdefault(normalized, str(value))
+        self.project_github_collisions = {name: keys for name, keys in keys_by_name.items() if len(keys) > 1}
+
+
+class BuildStats:
+    """Wall time per pipeline stage plus thread-safe named counters, for --profile; `network`
+    stages cut short by --deadline are listed in `degraded`."""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        self.degraded: list[str] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str, network: bool = False) -> Iterator[None]:
+        token = _NETWORK_STAGE.set(name) if network else None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if token is not None:
+                _NETWORK_STAGE.reset(token)
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def deadline_skip(self) -> None:
+        stage = _NETWORK_STAGE.get()
+        with self._lock:
+            self.counters["deadline_skipped"] = self.counters.get("deadline_skipped", 0) + 1
+            if stage is not None and stage not in self.degraded:
+                self.degraded.append(stage)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "total_seconds": round(sum(self.stages.values()), 6),
+            "counters": dict(sorted(self.counters.items())),
+            "degraded": list(self.degraded),
+        }
+
+    def report(self) -> str:
+        total = sum(self.stages.values()) or 1.0
+        lines = [f"{'stage':<20}{'ms':>10}{'share':>8}"]
+        for name, seconds in self.stages.items():
+            lines.append(f"{name:<20}{seconds * 1000:>10.1f}{seconds / total:>8.0%}")
+        lines.append(f"{'total':<20}{sum(self.stages.values()) * 1000:>10.1f}")
+        if self.degraded:
+            lines.append(f"degraded by --deadline: {', '.join(self.degraded)}")
+        lines.extend(f"{name:<28}{value:>10,}" for name, value in sorted(self.counters.items()))
+        return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_name(value: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", value.strip().lower())
-    normalized = re.sub(r"-+", "-", normalized).strip("-")
-    return normalized
+    # Each run of non-alphanumerics becomes one "-", so no "--" can remain.
+    return _NON_ALNUM_RE.sub("-", value.strip().lower()).strip("-")
+
+
+# JSON types each config key accepts; numbers may also be given as strings.
+_NUMBER = (int, float, str)
+CONFIG_TYPES: dict[str, type | tuple[type, ...]] = {
+    "scan_paths": list,
+    "skip_projects": list,
+    "exclude_projects": list,
+    "github_username": str,
+    "project_github": dict,
+    "max_projects": _NUMBER,
+    "preferred_projects": list,
+    "github_fallback_limit": _NUMBER,
+    "network_workers": _NUMBER,
+    "cache_ttl_seconds": _NUMBER,
+    "github_graphql": bool,
+    "jobs": _NUMBER,
+    "rate_limit_max_wait": _NUMBER,
+    "known_forks": list,
+    "prefetch_owned_repos": bool,
+}
 
 
 def load_config(root: Path, config_path: Path) -> BuilderConfig:
@@ -46,6 +226,13 @@ def load_config(root: Path, config_path: Path) -> BuilderConfig:
         raw = json.loads(config_path.read_text(encoding="utf-8"))
     else:
         raw = {}
+    if not isinstance(raw, dict):
+        raise ValueError(f"{config_path}: expected a JSON object, got {type(raw).__name__}")
+    for key, expected in CONFIG_TYPES.items():
+        if key in raw and ((isinstance(raw[key], bool) and expected is _NUMBER) or not isinstance(raw[key], expected)):
+            raise ValueError(f"{config_path}: {key!r} has the wrong type ({type(raw[key]).__name__})")
+    if not all(isinstance(path, str) for path in raw.get("scan_paths", [])):
+        raise ValueError(f"{config_path}: 'scan_paths' must be a list of strings")
 
     return BuilderConfig(
         scan_paths=raw.get("scan_paths", [".."]),
@@ -56,20 +243,84 @@ def load_config(root: Path, config_path: Path) -> BuilderConfig:
         max_projects=int(raw.get("max_projects", 24)),
         preferred_projects=[normalize_name(str(name)) for name in raw.get("preferred_projects", [])],
         github_fallback_limit=int(raw.get("github_fallback_limit", 30)),
+        network_workers=max(1, int(raw.get("network_workers", 8))),
+        cache_ttl_seconds=int(raw.get("cache_ttl_seconds", 6 * 60 * 60)),
+        github_graphql=bool(raw.get("github_graphql", True)),
+        jobs=max(1, int(raw.get("jobs", 1))),
+        rate_limit_max_wait=float(raw.get("rate_limit_max_wait", 60.0)),
+        known_forks=parse_known_forks(raw.get("known_forks", []), raw.get("github_username", "").strip()),
+        prefetch_owned_repos=bool(raw.get("prefetch_owned_repos", True)),
     )
 
 
+def parse_known_forks(entries: Iterable[object], github_username: str) -> set[str]:
+    """Lowercased "owner/repo" refs from known_forks; bare names belong to github_username."""
+    refs: set[str] = set()
+    for entry in entries:
+        value = str(entry).strip()
+        repo_ref = parse_github_repo(value)
+        if repo_ref:
+            value = "/".join(repo_ref)
+        elif "/" not in value:
+            if not value or not github_username:
+                continue
+            value = f"{github_username}/{value}"
+        refs.add(value.lower())
+    return refs
+
+
 def find_readme(project_dir: Path) -> Path | None:
+    # One directory listing instead of an exists()/is_file() stat per candidate.
+    try:
+        with os.scandir(project_dir) as entries:
+            files = {entry.name: entry for entry in entries}
+    except OSError:
+        return None
     for name in README_CANDIDATES:
-        candidate = project_dir / name
-        if candidate.exists() and candidate.is_file():
-            return candidate
+        entry = files.get(name)
+        if entry is not None and entry.is_file():
+            return project_dir / name
     return None
 
 
+def iter_unfenced_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield what re.sub(r"```[\\s\\S]*?```", "", text).splitlines() would, reading `lines`
+    (consecutive "\\n"-terminated pieces of `text`) one at a time."""
+    pending = ""
+    held: list[str] = []
+    in_fence = False
+    for raw in lines:
+        pos = 0
+        while True:
+            found = raw.find(README_FENCE, pos)
+            if in_fence:
+                if found == -1:
+                    held.append(raw[pos:])
+                    break
+                in_fence, held = False, []
+            else:
+                if found == -1:
+                    pending += raw[pos:]
+                    break
+                pending += raw[pos:found]
+                in_fence, held = True, [README_FENCE]
+            pos = found + len(README_FENCE)
+
+        parts = pending.splitlines(keepends=True)
+        pending = parts.pop() if parts and parts[-1].splitlines()[0] == parts[-1] else ""
+        for part in parts:
+            yield part.splitlines()[0]
+
+    pending += "".join(held)
+    yield from pending.splitlines()
+
+
 def summarize_readme(content: str) -> str:
-    text = re.sub(r"```[\s\S]*?```", "", content)
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return summarize_lines(iter_unfenced_lines(io.StringIO(content)))
+
+
+def summarize_lines(lines: Iterable[str]) -> str:
+    """Build the summary from fence-free README lines, pulling no more than it needs."""
     cleaned: list[str] = []
     noise_re = re.compile(r"^(installation|usage|setup|license|contributing|table of contents|quick start|get started|getting started)\b", re.I)
 
@@ -97,7 +348,10 @@ def summarize_readme(content: str) -> str:
             return True
         return False
 
-    for line in lines:
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
         if line.startswith("#") or line.startswith("!["):
             continue
         line = clean_line(line)
@@ -127,59 +381,399 @@ def summarize_readme(content: str) -> str:
     return f"{trimmed}…"
 
 
+class SkillMatcher:
+    """SKILL_RULES compiled into one regex that finds every keyword, overlapping ones included,
+    in a single pass."""
+
+    def __init__(self, rules: list[tuple[str, list[str]]]) -> None:
+        self.rules = [
+            (skill, tuple(keyword.lower().strip() for keyword in keywords if keyword.strip()))
+            for skill, keywords in rules
+        ]
+        keywords = sorted({keyword for _, group in self.rules for keyword in group}, key=lambda k: (-len(k), k))
+        self.longest = len(keywords[0]) if keywords else 0
+        phrases = [k for k in keywords if any(separator in k for separator in SKILL_SEPARATORS)]
+        words = [k for k in keywords if k not in phrases]
+
+        # Group 1 captures phrases, group 2 words. A group per keyword would be
+        # simpler to decode but stops sre from optimizing the alternation.
+        phrase_alt = "|".join(r"\s+".join(map(re.escape, k.split(" "))) for k in phrases) or "(?!)"
+        word_alt = "|".join(map(re.escape, words)) or "(?!)"
+        self._pattern = re.compile(rf"(?=({phrase_alt})|(?<![a-z0-9])({word_alt})(?![a-z0-9]))")
+        self._implied = {
+            k: [
+                (shorter, shorter in words)
+                for shorter in keywords
+                if shorter != k and k.startswith(shorter) and (shorter in phrases or k[len(shorter)] not in _ALNUM)
+            ]
+            for k in keywords
+        }
+
+    def find(self, text: str) -> set[str]:
+        """Every keyword occurring in `text`, which must already be lowercased."""
+        hits: set[str] = set()
+        self.collect(text, hits)
+        return hits
+
+    def collect(self, text: str, hits: set[str], partial_end: bool = False) -> None:
+        """Add the keywords found in `text` to `hits`.
+
+        With `partial_end` the text may continue past its end, so a word that
+        touches the end is not counted yet; SkillScan rescans it with more text.
+        """
+        for match in self._pattern.finditer(text):
+            phrase, word = match.groups()
+            if word is not None and partial_end and match.end(2) == len(text):
+                continue
+            keyword = " ".join(phrase.split()) if phrase is not None else word
+            hits.add(keyword)
+            start = match.start()
+            for shorter, needs_boundary in self._implied[keyword]:
+                if not needs_boundary or start == 0 or text[start - 1] not in _ALNUM:
+                    hits.add(shorter)
+
+    def skills_for(self, hits: set[str]) -> list[str]:
+        return [skill for skill, keywords in self.rules if any(keyword in hits for keyword in keywords)]
+
+    def skills(self, text: str) -> list[str]:
+        return self.skills_for(self.find(text))
+
+
+class SkillScan:
+    """SkillMatcher.find over text that arrives in pieces, scanned in blocks of about
+    SKILL_SCAN_BLOCK characters so the whole text is never held."""
+
+    def __init__(self, matcher: SkillMatcher) -> None:
+        self.matcher = matcher
+        self.hits: set[str] = set()
+        self._carry = ""
+        self._pending: list[str] = []
+        self._pending_size = 0
+
+    def feed(self, text: str) -> None:
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= SKILL_SCAN_BLOCK:
+            self._scan(partial_end=True)
+
+    def skills(self) -> list[str]:
+        self._scan(partial_end=False)
+        return self.matcher.skills_for(self.hits)
+
+    def _scan(self, partial_end: bool) -> None:
+        block = _WHITESPACE_RE.sub(" ", self._carry + "".join(self._pending).lower())
+        self._pending, self._pending_size = [], 0
+        self.matcher.collect(block, self.hits, partial_end)
+
+        keep = max(0, len(block) - self.matcher.longest + 1)
+        while keep > 0 and block[keep - 1] in _ALNUM:
+            keep -= 1
+        self._carry = block[keep:]
+
+
+@functools.cache
+def skill_matcher() -> SkillMatcher:
+    """The SkillMatcher for SKILL_RULES, compiled on first use rather than at import."""
+    return SkillMatcher(SKILL_RULES)
+
+
 def infer_skills(project_name: str, readme_text: str) -> list[str]:
-    corpus = re.sub(r"\s+", " ", f"{project_name} {readme_text}".lower())
+    return _finish_skills(skill_matcher().skills(f"{project_name} {readme_text}".lower()))
 
-    def has_keyword(keyword: str) -> bool:
-        token = keyword.lower().strip()
-        if not token:
-            return False
-        if any(separator in token for separator in (" ", ".", "/", "+", "-")):
-            return token in corpus
-        return re.search(rf"(?<![a-z0-9]){re.escape(token)}(?![a-z0-9])", corpus) is not None
-
-    rules = [
-        ("Full Stack", ["full stack", "end-to-end", "frontend", "backend"]),
-        ("Backend", ["backend", "api", "microservice", "fastapi", "flask", "django", "server"]),
-        ("Frontend", ["frontend", "react", "next.js", "astro", "ui", "web app", "javascript", "typescript"]),
-        ("DevOps", ["docker", "kubernetes", "ci/cd", "github actions", "terraform", "helm", "ansible"]),
-        ("AI", ["ai", "artificial intelligence", "agent", "generative", "inference"]),
-        ("LLMs", ["llm", "gpt", "transformer", "chatbot", "prompt"]),
-        ("RAG", ["rag", "retrieval augmented", "vector database", "embedding", "semantic search"]),
-        ("Python", ["python", "pytorch", "tensorflow", "numpy", "pandas"]),
-        ("Machine Learning", ["machine learning", "ml", "classification", "regression"]),
-        ("Deep Learning", ["deep learning", "neural", "transformer", "lstm"]),
-        ("NLP", ["nlp", "language model", "llm", "bert", "gpt"]),
-        ("Computer Vision", ["opencv", "vision", "image", "object detection"]),
-        ("AWS", ["aws", "ec2", "s3", "lambda", "autoscaling"]),
-        ("Java", ["java", "spring"]),
-    ]
-    skills: list[str] = []
-    for skill, keywords in rules:
-        if any(has_keyword(keyword) for keyword in keywords):
-            skills.append(skill)
 
+def _finish_skills(skills: list[str]) -> list[str]:
     if not skills:
         skills = ["Backend", "AI"]
 
     return skills[:6]
 
 
-def resolve_repo_link(project_name: str, cfg: BuilderConfig) -> str:
+def analyze_readme(readme: Path, project_name: str) -> tuple[str, list[str]]:
+    """Summary and skills for one README, the same as summarize_readme / infer_skills,
+    from a single line-by-line read."""
+    scan = SkillScan(skill_matcher())
+    scan.feed(f"{project_name} ")
+    with readme.open(encoding="utf-8", errors="ignore") as handle:
+
+        def scanned_lines() -> Iterator[str]:
+            for line in handle:
+                scan.feed(line)
+                yield line
+
+        lines = scanned_lines()
+        summary = summarize_lines(iter_unfenced_lines(lines))
+        for _ in lines:
+            pass
+    return summary, _finish_skills(scan.skills())
+
+
+def manifest_fingerprint() -> str:
+    rules = json.dumps(
+        {"version": BUILDER_VERSION, "skills": SKILL_RULES, "noise": sorted(NOISE_SECTION_PREFIXES)},
+        sort_keys=True,
+    )
+    return hashlib.sha256(rules.encode("utf-8")).hexdigest()
+
+
+class ReadmeManifest:
+    """Description/skills per README, persisted next to projects.ts and reused while the
+    README content, BUILDER_VERSION and the skill rules are unchanged."""
+
+    def __init__(self, path: Path, reuse: bool = True) -> None:
+        self.path = path
+        self.fingerprint = manifest_fingerprint()
+        self._entries: dict[str, dict[str, object]] = {}
+        self._seen: dict[str, dict[str, object]] = {}
+        self._stale: dict[str, dict[str, object]] = {}
+        self._lock = threading.Lock()
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8")) if reuse else {}
+        except (OSError, ValueError):
+            raw = {}
+        if isinstance(raw, dict) and raw.get("fingerprint") == self.fingerprint:
+            entries = raw.get("readmes", {})
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def analyze(self, readme: Path, project_name: str) -> tuple[str, list[str]]:
+        derived = self.cached(readme)
+        if derived is None:
+            derived = analyze_readme(readme, project_name)
+            self.record(readme, *derived)
+        return derived
+
+    def cached(self, readme: Path) -> tuple[str, list[str]] | None:
+        """The stored derivation if `readme` is unchanged; otherwise None, and
+        the file's stat and hash are kept for the following record() call."""
+        key = str(readme)
+        stat = readme.stat()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return self._remember(key, entry)
+
+        digest = hashlib.sha256()
+        with readme.open("rb") as handle:
+            for block in iter(lambda: handle.read(SKILL_SCAN_BLOCK), b""):
+                digest.update(block)
+        fresh = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest.hexdigest()}
+        if entry is not None and entry.get("sha256") == fresh["sha256"]:
+            return self._remember(key, {**entry, **fresh})
+        with self._lock:
+            self._stale[key] = fresh
+        return None
+
+    def record(self, readme: Path, description: str, skills: list[str]) -> None:
+        key = str(readme)
+        with self._lock:
+            fresh = self._stale.pop(key, None)
+        if fresh is None:
+            stat = readme.stat()
+            fresh = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": ""}
+        self._remember(key, {**fresh, "description": description, "skills": skills})
+
+    def _remember(self, key: str, entry: dict[str, object]) -> tuple[str, list[str]]:
+        with self._lock:
+            self._seen[key] = entry
+        return str(entry["description"]), list(entry["skills"])
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"fingerprint": self.fingerprint, "readmes": dict(sorted(self._seen.items()))}
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=1)
+        os.replace(tmp_name, self.path)
+
+    def rollover(self) -> None:
+        """Start another pass in the same process: what this pass saw becomes the cache."""
+        with self._lock:
+            self._entries, self._seen, self._stale = self._seen, {}, {}
+
+
+def scan_readmes(root: Path, cfg: BuilderConfig, stats: BuildStats | None = None) -> list[tuple[str, Path]]:
+    """(directory name, README path) for every scannable checkout, in output order."""
+    stats = stats or BuildStats()
+    found: list[tuple[str, Path]] = []
+    this_repo_name = normalize_name(root.name)
+
+    for scan_path in cfg.scan_paths:
+        base = (root / scan_path).resolve()
+        try:
+            with os.scandir(base) as listing:
+                entries = sorted(listing, key=lambda item: item.name.lower())
+        except OSError:
+            continue
+
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            if entry.name.startswith("."):
+                continue
+            child_name = normalize_name(entry.name)
+            if child_name in cfg.skip_projects:
+                stats.count("dropped_skip")
+                continue
+            if child_name == this_repo_name:
+                continue
+            if child_name in cfg.exclude_projects:
+                stats.count("dropped_exclude")
+                continue
+
+            readme = find_readme(base / entry.name)
+            if readme:
+                found.append((entry.name, readme))
+            else:
+                stats.count("dropped_no_readme")
+
+    return found
+
+
+def analyze_readmes(
+    found: list[tuple[str, Path]],
+    jobs: int = 1,
+    manifest: ReadmeManifest | None = None,
+    stats: BuildStats | None = None,
+) -> list[tuple[str, list[str]]]:
+    """analyze_readme for each (name, README) pair, results in input order.
+
+    READMEs the manifest can answer never leave this process; the rest are
+    spread over `jobs` worker processes when there is more than one.
+    """
+    stats = stats or BuildStats()
+    results: list[tuple[str, list[str]] | None] = [None] * len(found)
+    pending: list[int] = []
+    for index, (_, readme) in enumerate(found):
+        cached = manifest.cached(readme) if manifest is not None else None
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending.append(index)
+
+    names = [found[index][0] for index in pending]
+    readmes = [found[index][1] for index in pending]
+    stats.count("readmes_reused", len(found) - len(pending))
+    stats.count("readmes_parsed", len(pending))
+    # analyze_readme reads every byte once for the skill scan.
+    stats.count("readme_bytes_read", sum(readme.stat().st_size for readme in readmes))
+    if jobs > 1 and len(pending) > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # collect_projects has GitHub threads running by now; forking a threaded
+        # process can deadlock the child, so workers never start with fork.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(method)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending)), mp_context=context) as pool:
+            derived = list(pool.map(analyze_readme, readmes, names, chunksize=max(1, len(pending) // (jobs * 4))))
+    else:
+        derived = [analyze_readme(readme, name) for readme, name in zip(readmes, names)]
+
+    for index, (description, skills) in zip(pending, derived):
+        results[index] = (description, skills)
+        if manifest is not None:
+            manifest.record(found[index][1], description, skills)
+    return results
+
+
+def resolve_repo_link(project_name: str, cfg: BuilderConfig, origin: str = "") -> str:
+    """project_github first, then the checkout's `origin` remote, then a guess under github_username."""
     direct = cfg.project_github.get(project_name)
     if direct:
         return direct
 
-    lowered = normalize_name(project_name)
-    for key, value in cfg.project_github.items():
-        if normalize_name(str(key)) == lowered:
-            return str(value)
+    indexed = cfg.project_github_index.get(normalize_name(project_name))
+    if indexed is not None:
+        return indexed
+
+    if origin:
+        return origin
 
     if cfg.github_username:
         return f"https://github.com/{cfg.github_username}/{project_name}"
     return ""
 
 
+def _git_config_path(project_dir: Path) -> Path | None:
+    dot_git = project_dir / ".git"
+    if dot_git.is_dir():
+        return dot_git / "config"
+    # Worktrees and submodules have a ".git" file pointing at the real git dir;
+    # a worktree's remotes live in the main repository's config (its commondir).
+    try:
+        pointer = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not pointer.startswith("gitdir:"):
+        return None
+    git_dir = project_dir / pointer[len("gitdir:") :].strip()
+    try:
+        git_dir = git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        pass
+    return git_dir / "config"
+
+
+def read_git_remotes(project_dir: Path) -> dict[str, str]:
+    """Remote name -> URL from the checkout's git config, read directly rather than via `git`."""
+    config_path = _git_config_path(project_dir)
+    if config_path is None:
+        return {}
+    try:
+        text = config_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return {}
+
+    remotes: dict[str, str] = {}
+    remote: str | None = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("["):
+            section = _GIT_REMOTE_SECTION_RE.match(stripped)
+            remote = section.group(1) if section else None
+            continue
+        key, separator, value = stripped.partition("=")
+        if remote is not None and separator and key.strip().lower() == "url":
+            remotes.setdefault(remote, value.strip().strip('"'))
+    return remotes
+
+
+def github_remote_link(url: str) -> str:
+    """https://github.com/{owner}/{repo} for an HTTPS, SSH or scp-style GitHub remote, else ""."""
+    url = url.strip()
+    if "://" in url:
+        parsed = urlparse(url)
+        host, path = parsed.hostname or "", parsed.path
+    else:
+        scp = _SCP_REMOTE_RE.match(url)
+        if not scp:
+            return ""
+        host, path = scp.group(1), scp.group(2)
+    if host.lower().replace("www.", "") not in ("github.com", "ssh.github.com"):
+        return ""
+    parts = [part for part in path.strip("/").split("/") if part]
+    if len(parts) < 2:
+        return ""
+    return f"https://github.com/{parts[0]}/{parts[1].removesuffix('.git')}"
+
+
+def local_repo_ownership(project_dir: Path, github_username: str) -> tuple[str, bool | None]:
+    """The checkout's GitHub `origin` link, and False if its git remotes show a fork or
+    another owner, else None (only GitHub can tell)."""
+    remotes = read_git_remotes(project_dir)
+    origin = github_remote_link(remotes.get("origin", ""))
+    if not origin:
+        return "", None
+    upstream = remotes.get("upstream")
+    if upstream is not None:
+        upstream_link = github_remote_link(upstream) or upstream
+        if canonical_github_link(upstream_link) != canonical_github_link(origin):
+            return origin, False
+    if github_username and origin.split("/")[3].lower() != github_username.lower():
+        return origin, False
+    return origin, None
+
+
 def canonical_github_link(link: str) -> str:
     if not link:
         return ""
@@ -190,18 +784,51 @@ def canonical_github_link(link: str) -> str:
     return f"{host}{path}"
 
 
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
 def canonical_name_key(name: str) -> str:
-    normalized = normalize_name(name)
-    normalized = re.sub(r"(?:-|_)?backup(?:-|_)?\d.*$", "", normalized)
-    normalized = re.sub(r"(?:-|_)?\d{8,}$", "", normalized)
-    normalized = re.sub(r"(?:-|_)?(copy|old)$", "", normalized)
-    normalized = re.sub(r"-+", "-", normalized).strip("-")
-    return normalized
+    # normalize_name leaves only [a-z0-9-] without "--", so "_" never needs
+    # matching and trimming a suffix cannot create a doubled "-".
+    normalized = _BACKUP_SUFFIX_RE.sub("", normalize_name(name))
+    normalized = _TIMESTAMP_SUFFIX_RE.sub("", normalized)
+    normalized = _COPY_SUFFIX_RE.sub("", normalized)
+    return normalized.strip("-")
 
 
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
 def is_backup_like_name(name: str) -> bool:
-    normalized = normalize_name(name)
-    return bool(re.search(r"(?:^|-)(backup|copy|old)(?:-|$)", normalized))
+    return _BACKUP_WORD_RE.search(normalize_name(name)) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    """One portfolio entry, from a README checkout or a GitHub repo payload, with the dedup and
+    ranking keys derived once at construction."""
+
+    name: str
+    description: str
+    link: str
+    skills: tuple[str, ...]
+    normalized_name: str = field(init=False, repr=False, compare=False)
+    canonical_name: str = field(init=False, repr=False, compare=False)
+    canonical_link: str = field(init=False, repr=False, compare=False)
+    base_score: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        skills = tuple(self.skills)
+        link = self.link.strip()
+        score = min(len(skills), 6) * 12 + min(len(self.description), 220) // 12
+        score += sum(1 for tag in skills if tag in PRIORITY_TAGS) * 10
+        if link.startswith("https://github.com/"):
+            score += 8
+        object.__setattr__(self, "skills", skills)
+        object.__setattr__(self, "normalized_name", normalize_name(self.name))
+        object.__setattr__(self, "canonical_name", canonical_name_key(self.name.strip()))
+        object.__setattr__(self, "canonical_link", canonical_github_link(link))
+        object.__setattr__(self, "base_score", score)
+
+    def as_dict(self) -> dict[str, object]:
+        """The shape written to projects.ts."""
+        return {"name": self.name, "description": self.description, "link": self.link, "skills": list(self.skills)}
 
 
 def parse_github_repo(link: str) -> tuple[str, str] | None:
@@ -218,278 +845,1250 @@ def parse_github_repo(link: str) -> tuple[str, str] | None:
     return owner, repo
 
 
-def is_original_repo(link: str, github_username: str, cache: dict[str, bool]) -> bool:
-    repo_ref = parse_github_repo(link)
-    if not repo_ref:
-        return True
+@dataclass
+class ApiResponse:
+    payload: object
+    headers: dict[str, str]
+    from_cache: bool = False
+    status: int = 200
+
+
+class ResponseCache:
+    """GitHub API responses persisted as one JSON file, keyed by request URL; entries older
+    than `ttl` (or all of them with `refresh`) are revalidated."""
+
+    def __init__(self, path: Path, ttl: float, refresh: bool = False) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: dict[str, dict[str, object]] = {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raw = {}
+        if isinstance(raw, dict):
+            self._entries = {url: entry for url, entry in raw.items() if isinstance(entry, dict)}
+
+    def lookup(self, url: str) -> dict[str, object] | None:
+        with self._lock:
+            return self._entries.get(url)
+
+    def is_fresh(self, entry: dict[str, object]) -> bool:
+        if self.refresh:
+            return False
+        fetched_at = entry.get("fetched_at", 0)
+        return isinstance(fetched_at, (int, float)) and time.time() - fetched_at < self.ttl
+
+    def store(self, url: str, payload: object, headers: dict[str, str]) -> None:
+        with self._lock:
+            self._entries[url] = {"payload": payload, "headers": headers, "fetched_at": time.time()}
+            self._dirty = True
+
+    def touch(self, url: str) -> None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                entry["fetched_at"] = time.time()
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self._entries, handle)
+            os.replace(tmp_name, self.path)
+            self._dirty = False
 
-    owner, repo = repo_ref
-    if github_username and owner.lower() != github_username.lower():
-        return False
 
-    cache_key = f"{owner.lower()}/{repo.lower()}"
-    if cache_key in cache:
-        return cache[cache_key]
+@dataclass
+class HttpResult:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class AsyncHttpPool:
+    """Keep-alive HTTP/1.1 connections, at most `limit` in flight, served from sync callers
+    by an asyncio loop on a background thread; response header names are lowercased."""
+
+    def __init__(self, limit: int = 8) -> None:
+        self.limit = max(1, limit)
+        self._idle: dict[tuple[str, str, int], list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._ssl: ssl.SSLContext | None = None
+        self._start_lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+        deadline: float | None = None,
+    ) -> HttpResult:
+        import asyncio
+
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._semaphore = asyncio.Semaphore(self.limit)
+                self._thread = threading.Thread(target=self._loop.run_forever, name="github-http", daemon=True)
+                self._thread.start()
+            loop = self._loop
+        coroutine = self._request(method, url, headers, body, timeout, deadline)
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+        deadline: float | None = None,
+    ) -> HttpResult:
+        import asyncio
+
+        async with self._semaphore:
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    raise TimeoutError("deadline passed while waiting for a connection")
+            for _ in range(MAX_REDIRECTS):
+                result = await asyncio.wait_for(self._exchange(method, url, headers, body), timeout)
+                location = result.headers.get("location")
+                if method != "GET" or result.status not in (301, 302, 307, 308) or not location:
+                    return result
+                url = urljoin(url, location)
+            return result
+
+    async def _exchange(self, method: str, url: str, headers: dict[str, str], body: bytes | None) -> HttpResult:
+        import asyncio
+        import ssl
+
+        parsed = urlparse(url)
+        secure = parsed.scheme == "https"
+        key = (parsed.scheme, parsed.hostname or "", parsed.port or (443 if secure else 80))
+        target = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {parsed.netloc}", "Accept-Encoding: identity"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        message = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+        idle = self._idle.setdefault(key, [])
+        while True:
+            reused = bool(idle)
+            if reused:
+                reader, writer = idle.pop()
+            else:
+                if secure and self._ssl is None:
+                    self._ssl = ssl.create_default_context()
+                reader, writer = await asyncio.open_connection(key[1], key[2], ssl=self._ssl if secure else None)
+            try:
+                writer.write(message)
+                await writer.drain()
+                result, keep_alive = await _read_http_response(reader, method)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    # The server dropped an idle connection; retry on a fresh one.
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                idle.append((reader, writer))
+            else:
+                writer.close()
+            return result
+
+    def close(self) -> None:
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        import asyncio
+
+        async def drain_idle() -> None:
+            for connections in self._idle.values():
+                for _, writer in connections:
+                    writer.close()
+            self._idle.clear()
+
+        asyncio.run_coroutine_threadsafe(drain_idle(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+
+
+async def _read_http_response(reader: asyncio.StreamReader, method: str) -> tuple[HttpResult, bool]:
+    """Parse one response off `reader`; the flag says whether the connection can be reused."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed before a response")
+    version, status = status_line.split(None, 2)[:2]
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip().lower(), value.strip()
+        headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+    code = int(status)
+    keep_alive = version == b"HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if method == "HEAD" or code in (204, 304) or code < 200:
+        body = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return HttpResult(code, headers, body), keep_alive
 
-    api_url = f"https://api.github.com/repos/{owner}/{repo}"
-    request = Request(api_url, headers={"Accept": "application/vnd.github+json", "User-Agent": "portfolio-builder"})
 
-    try:
-        with urlopen(request, timeout=8) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-            is_fork = bool(payload.get("fork", False))
-            cache[cache_key] = not is_fork
-            return not is_fork
-    except Exception:
-        cache[cache_key] = True
-        return True
+def _urlopen_request(method: str, url: str, headers: dict[str, str], body: bytes | None, timeout: float) -> HttpResult:
+    """Blocking fallback through urllib, which honours HTTP(S)_PROXY settings."""
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
 
+    try:
+        with urlopen(Request(url, data=body, headers=headers, method=method), timeout=timeout) as response:
+            return HttpResult(response.status, {k.lower(): v for k, v in response.headers.items()}, response.read())
+    except HTTPError as error:
+        return HttpResult(error.code, {k.lower(): v for k, v in error.headers.items()}, error.read())
+
+
+class RateLimitExceeded(RuntimeError):
+    """The quota is spent and resets later than the scheduler is willing to wait."""
+
+
+class DeadlineExceeded(RateLimitExceeded):
+    """The rate-limit wait fits max_wait but not the time left before --deadline."""
+
+
+class RateLimitScheduler:
+    """Paces GitHub requests against its rate-limit headers, raising RateLimitExceeded
+    instead of waiting longer than `max_wait`; 5xx and rate-limit responses are retried `retries` times."""
+
+    def __init__(self, max_wait: float = 60.0, reserve: int = 10, retries: int = 3) -> None:
+        self.max_wait = max_wait
+        self.reserve = reserve
+        self.retries = retries
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait_turn(self, budget: float | None = None) -> float:
+        """Block until a request may be sent; returns the seconds spent waiting.
+
+        A wait longer than `budget` (or max_wait) raises RateLimitExceeded.
+        """
+        with self._lock:
+            now = time.time()
+            delay = max(0.0, self.blocked_until - now)
+            reason = f"GitHub asked to retry in {delay:.0f}s"
+            metered = self.remaining is not None and self.reset_at > now
+            if metered and self.remaining <= 0:
+                if self.reset_at - now > delay:
+                    delay, reason = self.reset_at - now, f"GitHub rate limit resets in {self.reset_at - now:.0f}s"
+            elif metered and self.remaining < self.reserve:
+                # Spacing only paces the requests still allowed, so it never
+                # waits past max_wait; a far-off reset just means sending sooner.
+                spacing = min((self.reset_at - now) / self.remaining, self.max_wait)
+                if spacing > delay:
+                    delay, reason = spacing, f"rate limit spacing of {spacing:.0f}s"
+            if delay and delay > self.max_wait:
+                raise RateLimitExceeded(reason)
+            if delay and budget is not None and delay > budget:
+                raise DeadlineExceeded(f"{reason} outlasts the deadline")
+            if metered:
+                # Claim a request now so concurrent callers see the smaller budget.
+                self.remaining -= 1
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def observe(self, status: int, headers: dict[str, str], attempt: int) -> float | None:
+        """Record a response; returns a delay before retrying it, or None to keep it."""
+        now = time.time()
+        with self._lock:
+            remaining = headers.get("x-ratelimit-remaining", "")
+            reset = headers.get("x-ratelimit-reset", "")
+            if remaining.isdigit() and reset.isdigit():
+                self.remaining, self.reset_at = int(remaining), float(reset)
+            retry_after = headers.get("retry-after", "")
+            rate_limited = status == 429 or (status == 403 and (retry_after or self.remaining == 0))
+            if rate_limited:
+                wait = float(retry_after) if retry_after.isdigit() else max(0.0, self.reset_at - now)
+                self.blocked_until = max(self.blocked_until, now + wait)
+        if attempt >= self.retries:
+            return None
+        if rate_limited:
+            return 0.0
+        if status >= 500:
+            return 0.5 * 2**attempt
+        return None
 
-def deduplicate_projects(projects: list[dict[str, object]], max_projects: int) -> list[dict[str, object]]:
-    unique_by_key: dict[str, dict[str, object]] = {}
 
-    for project in projects:
-        link = str(project.get("link", "")).strip()
-        name = str(project.get("name", "")).strip()
-        canonical_name = canonical_name_key(name)
-        key = f"name:{canonical_name}" if canonical_name else (canonical_github_link(link) or "name:")
+class GitHubClient:
+    """JSON helper shared by every GitHub lookup, with an optional ResponseCache.
+
+    A 404/410 is an answer (payload None, `status` set); None means the
+    request failed, or was not sent (`offline`, past `deadline`).
+    """
+
+    def __init__(
+        self,
+        api_base: str = GITHUB_API,
+        cache: ResponseCache | None = None,
+        token: str = "",
+        graphql: bool = True,
+        stats: BuildStats | None = None,
+        max_connections: int = 8,
+        scheduler: RateLimitScheduler | None = None,
+        offline: bool = False,
+    ) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.cache = cache
+        self.token = token
+        self.offline = offline
+        self.graphql = graphql and bool(token) and not offline
+        self.stats = stats or BuildStats()
+        self.http = AsyncHttpPool(max_connections)
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.deadline: float | None = None
+        self._proxied: bool | None = None
+
+    def time_left(self) -> float | None:
+        """Seconds until `deadline`, negative once it has passed; None without one."""
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def _failed(self, exc: Exception) -> None:
+        left = self.time_left()
+        if isinstance(exc, DeadlineExceeded) or (left is not None and left <= 0):
+            self.stats.deadline_skip()
+        else:
+            self.stats.count("http_errors")
+
+    def _send(self, method: str, url: str, headers: dict[str, str], body: bytes | None, timeout: float) -> HttpResult:
+        if self._proxied is None:
+            from urllib.request import getproxies, proxy_bypass
+
+            parsed = urlparse(self.api_base)
+            self._proxied = parsed.scheme in getproxies() and not proxy_bypass(parsed.hostname or "")
+        attempt = 0
+        while True:
+            waited = self.scheduler.wait_turn(self.time_left())
+            if waited:
+                self.stats.count("rate_limit_wait_ms", int(waited * 1000))
+            left = self.time_left()
+            if left is not None and left <= 0:
+                raise TimeoutError("build deadline reached")
+            self.stats.count("http_requests")
+            request_timeout = timeout if left is None else min(timeout, left)
+            if self._proxied:
+                result = _urlopen_request(method, url, headers, body, request_timeout)
+            else:
+                result = self.http.request(method, url, headers, body, request_timeout, self.deadline)
+            retry_in = self.scheduler.observe(result.status, result.headers, attempt)
+            if retry_in is None:
+                return result
+            left = self.time_left()
+            if left is not None and retry_in >= left:
+                return result
+            self.stats.count("http_retries")
+            time.sleep(retry_in)
+            attempt += 1
+
+    def _headers(self) -> dict[str, str]:
+        headers = {"Accept": "application/vnd.github+json", "User-Agent": "portfolio-builder"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def get_json(self, url: str, timeout: float) -> ApiResponse | None:
+        entry = self.cache.lookup(url) if self.cache else None
+        if entry is not None and (self.offline or self.cache.is_fresh(entry)):
+            self.stats.count("http_cache_hits")
+            return _cached_response(entry)
+        if self.offline:
+            self.stats.count("offline_misses")
+            return None
+        left = self.time_left()
+        if left is not None and left <= 0:
+            self.stats.deadline_skip()
+            return _cached_response(entry) if entry is not None else None
+
+        headers = self._headers()
+        if entry is not None:
+            validators = entry.get("headers", {})
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last-modified"):
+                headers["If-Modified-Since"] = validators["last-modified"]
 
-        current = unique_by_key.get(key)
-        if not current:
-            unique_by_key[key] = project
-            continue
+        try:
+            result = self._send("GET", url, headers, None, timeout)
+            if result.status == 304 and entry is not None:
+                self.stats.count("http_not_modified")
+                self.cache.touch(url)
+                return _cached_response(entry)
+            if result.status in GITHUB_NOT_FOUND:
+                self.stats.count("http_not_found")
+                return ApiResponse(None, {}, status=result.status)
+            if not 200 <= result.status < 300:
+                self.stats.count("http_errors")
+                return _cached_response(entry) if entry is not None else None
+            payload = json.loads(result.body.decode("utf-8"))
+            kept = {name: result.headers[name] for name in CACHED_HEADERS if result.headers.get(name)}
+        except Exception as exc:
+            self._failed(exc)
+            # Offline, timed out or out of time: a stale copy beats no answer at all.
+            return _cached_response(entry) if entry is not None else None
+
+        if self.cache:
+            self.cache.store(url, payload, kept)
+        return ApiResponse(payload, kept)
+
+    def post_json(self, url: str, body: object, timeout: float) -> ApiResponse | None:
+        if self.offline:
+            self.stats.count("offline_misses")
+            return None
+        left = self.time_left()
+        if left is not None and left <= 0:
+            self.stats.deadline_skip()
+            return None
+        headers = {**self._headers(), "Content-Type": "application/json"}
+        data = json.dumps(body).encode("utf-8")
+        try:
+            result = self._send("POST", url, headers, data, timeout)
+            if not 200 <= result.status < 300:
+                self.stats.count("http_errors")
+                return None
+            return ApiResponse(json.loads(result.body.decode("utf-8")), {})
+        except Exception as exc:
+            self._failed(exc)
+            return None
+
+    def close(self) -> None:
+        self.http.close()
+        if self.cache:
+            self.cache.save()
+
+
+_DEFAULT_CLIENT: GitHubClient | None = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def _default_client() -> GitHubClient:
+    """The client shared by lookups that are not given one: one pool, one scheduler."""
+    global _DEFAULT_CLIENT
+    with _DEFAULT_CLIENT_LOCK:
+        if _DEFAULT_CLIENT is None:
+            _DEFAULT_CLIENT = GitHubClient()
+        return _DEFAULT_CLIENT
+
+
+def _in_context(func: Callable[..., object]) -> Callable[..., object]:
+    """`func` run in a copy of the caller's context, for pool threads (which start with an empty one)."""
+    context = contextvars.copy_context()
+    return lambda *args: context.copy().run(func, *args)
+
+
+def _cached_response(entry: dict[str, object]) -> ApiResponse:
+    headers = entry.get("headers")
+    return ApiResponse(entry.get("payload"), dict(headers) if isinstance(headers, dict) else {}, from_cache=True)
+
+
+def parse_link_header(value: str) -> dict[str, str]:
+    links: dict[str, str] = {}
+    for part in value.split(","):
+        match = re.match(r'\s*<([^>]+)>\s*;\s*rel="([^"]+)"', part)
+        if match:
+            links[match.group(2)] = match.group(1)
+    return links
+
+
+def with_page(url: str, page: int) -> str:
+    parsed = urlparse(url)
+    query = [(key, value) for key, value in parse_qsl(parsed.query) if key != "page"]
+    query.append(("page", str(page)))
+    return parsed._replace(query=urlencode(query)).geturl()
+
+
+def iter_github_pages(client: GitHubClient, url: str, workers: int, timeout: float) -> Iterator[list[object]]:
+    """Yield every page of a paginated list endpoint in order, fetching `workers` pages at a
+    time once the first page's Link header gives the count."""
+    response = client.get_json(url, timeout)
+    if response is None or not isinstance(response.payload, list):
+        return
+    yield response.payload
+
+    links = parse_link_header(response.headers.get("link", ""))
+    last_page = dict(parse_qsl(urlparse(links.get("last", "")).query)).get("page", "")
+    if not last_page.isdigit():
+        next_url = links.get("next")
+        while next_url:
+            response = client.get_json(next_url, timeout)
+            if response is None or not isinstance(response.payload, list):
+                return
+            yield response.payload
+            next_url = parse_link_header(response.headers.get("link", "")).get("next")
+        return
+
+    urls = [with_page(links["last"], page) for page in range(2, int(last_page) + 1)]
+    if client.offline:
+        # Every page comes from the cache or not at all; no pool needed.
+        for page_url in urls:
+            response = client.get_json(page_url, timeout)
+            if response is not None and isinstance(response.payload, list):
+                yield response.payload
+        return
+    batch_size = max(1, workers)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=batch_size) as pool:
+        for start in range(0, len(urls), batch_size):
+            # Submitted explicitly: a batch that has been sent always completes,
+            # even if the caller closes the iterator partway through it.
+            batch = [pool.submit(_in_context(client.get_json), page_url, timeout) for page_url in urls[start : start + batch_size]]
+            for future in batch:
+                page = future.result()
+                if page is not None and isinstance(page.payload, list):
+                    yield page.payload
+
+
+def _graphql_repo_to_rest(node: dict[str, object]) -> dict[str, object]:
+    """Reshape a GraphQL repository node into the REST fields the collectors read."""
+    language = node.get("primaryLanguage")
+    topic_nodes = (node.get("repositoryTopics") or {}).get("nodes") or []
+    return {
+        "name": node.get("name"),
+        "fork": bool(node.get("isFork", False)),
+        "description": node.get("description"),
+        "html_url": node.get("url"),
+        "language": language.get("name") if isinstance(language, dict) else None,
+        "topics": [item["topic"]["name"] for item in topic_nodes if isinstance(item, dict) and item.get("topic")],
+    }
+
+
+def fetch_repo_metadata_batch(
+    client: GitHubClient,
+    refs: list[tuple[str, str]],
+    workers: int = 1,
+) -> dict[str, dict[str, object] | None]:
+    """Look up "owner/repo" refs with aliased GraphQL queries; None means NOT_FOUND and
+    missing refs should fall back to REST."""
+    unique = list({f"{owner.lower()}/{repo.lower()}": (owner, repo) for owner, repo in refs}.items())
+    if not client.graphql or not unique:
+        return {}
+
+    results: dict[str, dict[str, object] | None] = {}
+    rest_urls = {key: f"{client.api_base}/repos/{owner}/{repo}" for key, (owner, repo) in unique}
+    if client.cache:
+        misses = []
+        for key, ref in unique:
+            entry = client.cache.lookup(rest_urls[key])
+            if entry is not None and client.cache.is_fresh(entry) and isinstance(entry.get("payload"), dict):
+                client.stats.count("http_cache_hits")
+                results[key] = entry["payload"]
+            else:
+                misses.append((key, ref))
+        unique = misses
+
+    def run_chunk(chunk: list[tuple[str, tuple[str, str]]]) -> dict[str, dict[str, object] | None]:
+        aliases = {f"r{index}": key for index, (key, _) in enumerate(chunk)}
+        fields = " ".join(
+            f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{ {GRAPHQL_REPO_FIELDS} }}"
+            for index, (_, (owner, repo)) in enumerate(chunk)
+        )
+        response = client.post_json(f"{client.api_base}/graphql", {"query": f"query {{ {fields} }}"}, timeout=10)
+        payload = response.payload if response is not None else None
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, dict):
+            return {}
+
+        not_found = {
+            str(error["path"][0])
+            for error in payload.get("errors") or []
+            if isinstance(error, dict) and error.get("type") == "NOT_FOUND" and error.get("path")
+        }
+        answers: dict[str, dict[str, object] | None] = {}
+        for alias, key in aliases.items():
+            node = data.get(alias)
+            if isinstance(node, dict):
+                answers[key] = _graphql_repo_to_rest(node)
+            elif alias in not_found:
+                answers[key] = None
+        return answers
+
+    chunks = [unique[start : start + GRAPHQL_BATCH_SIZE] for start in range(0, len(unique), GRAPHQL_BATCH_SIZE)]
+    if not chunks:
+        return results
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as pool:
+        for answers in pool.map(_in_context(run_chunk), chunks):
+            results.update(answers)
+            for key, repo in answers.items():
+                if client.cache and repo is not None:
+                    client.cache.store(rest_urls[key], repo, {})
+    return results
+
+
+def is_original_repo(
+    link: str,
+    github_username: str,
+    cache: dict[str, bool],
+    client: GitHubClient | None = None,
+) -> bool:
+    repo_ref = parse_github_repo(link)
+    if not repo_ref:
+        return True
 
-        current_is_backup = is_backup_like_name(str(current.get("name", "")))
-        incoming_is_backup = is_backup_like_name(str(project.get("name", "")))
+    owner, repo = repo_ref
+    if github_username and owner.lower() != github_username.lower():
+        return False
 
-        if current_is_backup and not incoming_is_backup:
-            unique_by_key[key] = project
+    cache_key = f"{owner.lower()}/{repo.lower()}"
+    client = client or _default_client()
+    with _OWNERSHIP_CACHE_LOCK:
+        if cache_key in cache:
+            client.stats.count("ownership_cache_hits")
+            return cache[cache_key]
+
+    client.stats.count("ownership_lookups")
+    response = client.get_json(f"{client.api_base}/repos/{owner}/{repo}", timeout=8)
+    if response is None:
+        # Rate limited, timed out or a server error: not an answer, so keep
+        # the repo for this build but leave the cache for a later lookup.
+        client.stats.count("ownership_unresolved")
+        return True
+    original = not (isinstance(response.payload, dict) and bool(response.payload.get("fork", False)))
+
+    with _OWNERSHIP_CACHE_LOCK:
+        return cache.setdefault(cache_key, original)
+
+
+def prefill_ownership_cache(
+    links: list[str],
+    github_username: str,
+    cache: dict[str, bool],
+    client: GitHubClient,
+    workers: int = 1,
+) -> None:
+    """Answer uncached fork checks for `links` with batched GraphQL lookups.
+
+    Repos GitHub reports as missing count as original, matching what a failed
+    REST lookup in is_original_repo yields; unanswered refs are left for REST.
+    """
+    refs: list[tuple[str, str]] = []
+    for link in links:
+        repo_ref = parse_github_repo(link)
+        if not repo_ref:
             continue
-        if incoming_is_backup and not current_is_backup:
+        owner, repo = repo_ref
+        if github_username and owner.lower() != github_username.lower():
             continue
+        with _OWNERSHIP_CACHE_LOCK:
+            if f"{owner.lower()}/{repo.lower()}" in cache:
+                continue
+        refs.append(repo_ref)
 
-        current_desc_len = len(str(current.get("description", "")))
-        incoming_desc_len = len(str(project.get("description", "")))
-        current_skills_len = len(current.get("skills", []) if isinstance(current.get("skills"), list) else [])
-        incoming_skills_len = len(project.get("skills", []) if isinstance(project.get("skills"), list) else [])
+    for key, metadata in fetch_repo_metadata_batch(client, refs, workers).items():
+        original = metadata is None or not bool(metadata.get("fork", False))
+        with _OWNERSHIP_CACHE_LOCK:
+            cache.setdefault(key, original)
 
-        if incoming_desc_len > current_desc_len or incoming_skills_len > current_skills_len:
-            unique_by_key[key] = project
 
-    deduped = list(unique_by_key.values())
-    deduped.sort(key=lambda item: str(item.get("name", "")).lower())
-    return deduped[:max_projects]
+def prefill_ownership_from_listing(repos: Iterable[object], github_username: str, cache: dict[str, bool]) -> int:
+    """Record the fork flag of every repo in an owned-repos listing; returns how many were new.
 
+    The listing covers the user's own repos only, so links it does not name
+    are left for is_original_repo. Existing verdicts are kept.
+    """
+    owner = github_username.lower()
+    added = 0
+    with _OWNERSHIP_CACHE_LOCK:
+        for repo in repos:
+            if not isinstance(repo, dict) or not repo.get("name"):
+                continue
+            key = f"{owner}/{str(repo['name']).lower()}"
+            if key not in cache:
+                cache[key] = not bool(repo.get("fork", False))
+                added += 1
+    return added
+
+
+def resolve_ownership(
+    links: list[str],
+    github_username: str,
+    cache: dict[str, bool],
+    workers: int,
+    client: GitHubClient | None = None,
+) -> dict[str, bool]:
+    """Run is_original_repo for every distinct link, up to `workers` at a time.
+
+    Verdicts are keyed by link so callers can filter in their own order; the
+    result is identical to calling is_original_repo serially.
+    """
+    client = client or _default_client()
+    unique_links = list(dict.fromkeys(link for link in links if link))
+    if client.graphql:
+        prefill_ownership_cache(unique_links, github_username, cache, client, workers)
+    if client.offline or workers <= 1 or len(unique_links) <= 1:
+        return {link: is_original_repo(link, github_username, cache, client) for link in unique_links}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique_links))) as pool:
+        lookup = _in_context(lambda link: is_original_repo(link, github_username, cache, client))
+        verdicts = pool.map(lookup, unique_links)
+        return dict(zip(unique_links, verdicts))
+
+
+def _dedup_keys(project: Project) -> list[str]:
+    """The keys deduplicate_projects merges on; projects sharing one collapse."""
+    keys = [f"name:{project.canonical_name}"] if project.canonical_name else []
+    if project.canonical_link:
+        keys.append(f"link:{project.canonical_link}")
+    return keys or ["name:"]
+
+
+def deduplicate_projects(
+    projects: list[Project],
+    max_projects: int | None = None,
+) -> list[Project]:
+    """Return one project per group sharing a canonical name or link, preferring non-backup names,
+    then longer descriptions and more skills; `max_projects` sorts the survivors by name and cuts them."""
+    parent = list(range(len(projects)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    first_with_key: dict[str, int] = {}
+    for index, project in enumerate(projects):
+        for key in _dedup_keys(project):
+            other = find(first_with_key.setdefault(key, index))
+            root = find(index)
+            if other != root:
+                # The earliest entry is always the root, which keeps group order stable.
+                parent[max(root, other)] = min(root, other)
+
+    survivors: dict[int, tuple[tuple[bool, int, int, int], Project]] = {}
+    for index, project in enumerate(projects):
+        rank = (
+            not is_backup_like_name(project.name),
+            len(project.description),
+            len(project.skills),
+            -index,
+        )
+        root = find(index)
+        current = survivors.get(root)
+        if current is None or rank > current[0]:
+            survivors[root] = (rank, project)
+
+    deduped = [project for _, project in survivors.values()]
+    if max_projects is None:
+        return deduped
+    deduped.sort(key=lambda item: item.name.lower())
+    return deduped[:max_projects]
 
-def project_quality_score(project: dict[str, object], preferred_projects: list[str]) -> int:
-    name = normalize_name(str(project.get("name", "")))
-    description = str(project.get("description", ""))
-    skills = project.get("skills", []) if isinstance(project.get("skills"), list) else []
-    link = str(project.get("link", "")).strip()
 
-    score = 0
-    if name in preferred_projects:
-        score += 1000
+def project_quality_score(project: Project, preferred_projects: Collection[str]) -> int:
+    # Skills, description length, priority tags and a GitHub link are scored
+    # once in Project.base_score; only the preferred bonus depends on the config.
+    if project.normalized_name in preferred_projects:
+        return project.base_score + 1000
+    return project.base_score
 
-    score += min(len(skills), 6) * 12
-    score += min(len(description), 220) // 12
 
-    priority_tags = {"AI", "LLMs", "RAG", "Backend", "DevOps", "Computer Vision", "Full Stack"}
-    score += len([tag for tag in skills if str(tag) in priority_tags]) * 10
+def rank_projects(projects: list[Project], cfg: BuilderConfig) -> list[Project]:
+    """The best `max_projects` by score, then name: a heap keeps this O(n log k)."""
+    preferred = frozenset(cfg.preferred_projects)
+    keyed = [
+        (-project_quality_score(project, preferred), project.name.lower(), index)
+        for index, project in enumerate(projects)
+    ]
+    # The index breaks remaining ties in input order, as a stable sort would.
+    return [projects[index] for _, _, index in heapq.nsmallest(max(0, cfg.max_projects), keyed)]
 
-    if link.startswith("https://github.com/"):
-        score += 8
 
-    return score
+def github_repo_project(repo: object, cfg: BuilderConfig) -> Project | None:
+    """Turn a REST-shaped repo payload into a project, or None if it should be skipped."""
+    if not isinstance(repo, dict):
+        return None
+    if bool(repo.get("fork", False)):
+        return None
 
+    name = str(repo.get("name", "")).strip()
+    if not name:
+        return None
+    if normalize_name(name) in cfg.exclude_projects:
+        return None
 
-def rank_projects(projects: list[dict[str, object]], cfg: BuilderConfig) -> list[dict[str, object]]:
-    ranked = sorted(
-        projects,
-        key=lambda project: (
-            -project_quality_score(project, cfg.preferred_projects),
-            str(project.get("name", "")).lower(),
-        ),
-    )
-    return ranked[: cfg.max_projects]
+    description = str(repo.get("description") or "").strip()
+    summary = description[:220] if description else "Original repository developed and maintained by me."
+    link = str(repo.get("html_url") or f"https://github.com/{cfg.github_username}/{name}")
+    topics = repo.get("topics", [])
+    topics_text = " ".join(topic for topic in topics if isinstance(topic, str)) if isinstance(topics, list) else ""
+    language = str(repo.get("language") or "")
+    inferred = infer_skills(name, f"{description} {topics_text} {language}")
 
+    return Project(name=name, description=summary, link=link, skills=inferred)
 
-def collect_owned_github_projects(cfg: BuilderConfig) -> list[dict[str, object]]:
-    if not cfg.github_username:
-        return []
 
+def owned_repos_pages(cfg: BuilderConfig, client: GitHubClient) -> Iterator[list[object]]:
     api_url = (
-        f"https://api.github.com/users/{cfg.github_username}/repos"
+        f"{client.api_base}/users/{cfg.github_username}/repos"
         "?type=owner&sort=updated&per_page=100"
     )
-    request = Request(api_url, headers={"Accept": "application/vnd.github+json", "User-Agent": "portfolio-builder"})
+    return iter_github_pages(client, api_url, cfg.network_workers, timeout=10)
 
-    try:
-        with urlopen(request, timeout=10) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except Exception:
-        return []
 
-    if not isinstance(payload, list):
+def collect_owned_github_projects(
+    cfg: BuilderConfig,
+    client: GitHubClient | None = None,
+    owned_repos: list[object] | None = None,
+) -> list[Project]:
+    """Original repos from the owned-repos listing, up to github_fallback_limit.
+
+    `owned_repos` is a listing already fetched in full; without it pages are
+    requested only until the limit is reached.
+    """
+    if not cfg.github_username:
         return []
 
-    projects: list[dict[str, object]] = []
-    for repo in payload:
-        if not isinstance(repo, dict):
-            continue
-        if bool(repo.get("fork", False)):
-            continue
-
-        name = str(repo.get("name", "")).strip()
-        if not name:
-            continue
-        if normalize_name(name) in cfg.exclude_projects:
+    client = client or _default_client()
+    projects: list[Project] = []
+    pages = owned_repos_pages(cfg, client) if owned_repos is None else None
+    repos = owned_repos if pages is None else (repo for page in pages for repo in page)
+    for repo in repos:
+        project = github_repo_project(repo, cfg)
+        if project is None:
             continue
 
-        description = str(repo.get("description") or "").strip()
-        summary = description[:220] if description else "Original repository developed and maintained by me."
-        link = str(repo.get("html_url") or f"https://github.com/{cfg.github_username}/{name}")
-        topics = repo.get("topics", [])
-        topics_text = " ".join(topic for topic in topics if isinstance(topic, str)) if isinstance(topics, list) else ""
-        language = str(repo.get("language") or "")
-        inferred = infer_skills(name, f"{description} {topics_text} {language}")
-
-        projects.append(
-            {
-                "name": name,
-                "description": summary,
-                "link": link,
-                "skills": inferred,
-            }
-        )
-
+        projects.append(project)
         if len(projects) >= cfg.github_fallback_limit:
             break
 
+    if pages is not None:
+        pages.close()
     return projects
 
 
 def collect_preferred_github_projects(
     cfg: BuilderConfig,
-    existing_projects: list[dict[str, object]],
-) -> list[dict[str, object]]:
+    existing_projects: list[Project],
+    client: GitHubClient | None = None,
+) -> list[Project]:
     if not cfg.github_username or not cfg.preferred_projects:
         return []
 
-    existing_names = {normalize_name(str(project.get("name", ""))) for project in existing_projects}
-    projects: list[dict[str, object]] = []
-
-    for preferred in cfg.preferred_projects:
-        repo_name = preferred.strip()
-        if not repo_name:
-            continue
-        if normalize_name(repo_name) in existing_names:
-            continue
+    existing_names = {project.normalized_name for project in existing_projects}
+    wanted = [
+        preferred.strip()
+        for preferred in cfg.preferred_projects
+        if preferred.strip() and normalize_name(preferred.strip()) not in existing_names
+    ]
+    return [project for _, project in fetch_preferred_github_projects(cfg, wanted, client)]
 
-        api_url = f"https://api.github.com/repos/{cfg.github_username}/{repo_name}"
-        request = Request(api_url, headers={"Accept": "application/vnd.github+json", "User-Agent": "portfolio-builder"})
 
-        try:
-            with urlopen(request, timeout=10) as response:
-                repo = json.loads(response.read().decode("utf-8"))
-        except Exception:
-            continue
+def fetch_preferred_github_projects(
+    cfg: BuilderConfig,
+    wanted: list[str],
+    client: GitHubClient | None = None,
+) -> list[tuple[str, Project]]:
+    """(requested name, project) for each repo in `wanted` that is an original under github_username."""
+    if not cfg.github_username or not wanted:
+        return []
 
-        if not isinstance(repo, dict):
-            continue
-        if bool(repo.get("fork", False)):
-            continue
+    client = client or _default_client()
+    batched = fetch_repo_metadata_batch(client, [(cfg.github_username, name) for name in wanted], cfg.network_workers)
+    projects: list[tuple[str, Project]] = []
 
-        name = str(repo.get("name", "")).strip()
-        if not name:
-            continue
-        if normalize_name(name) in cfg.exclude_projects:
-            continue
+    for repo_name in wanted:
+        key = f"{cfg.github_username.lower()}/{repo_name.lower()}"
+        if key in batched:
+            repo = batched[key]
+        else:
+            response = client.get_json(f"{client.api_base}/repos/{cfg.github_username}/{repo_name}", timeout=10)
+            repo = response.payload if response is not None else None
 
-        description = str(repo.get("description") or "").strip()
-        summary = description[:220] if description else "Original repository developed and maintained by me."
-        link = str(repo.get("html_url") or f"https://github.com/{cfg.github_username}/{name}")
-        topics = repo.get("topics", [])
-        topics_text = " ".join(topic for topic in topics if isinstance(topic, str)) if isinstance(topics, list) else ""
-        language = str(repo.get("language") or "")
-        inferred = infer_skills(name, f"{description} {topics_text} {language}")
-
-        projects.append(
-            {
-                "name": name,
-                "description": summary,
-                "link": link,
-                "skills": inferred,
-            }
-        )
+        project = github_repo_project(repo, cfg)
+        if project is not None:
+            projects.append((repo_name, project))
 
     return projects
 
 
-def collect_projects(root: Path, cfg: BuilderConfig) -> list[dict[str, object]]:
-    projects: list[dict[str, object]] = []
-    this_repo_name = normalize_name(root.name)
-    ownership_cache: dict[str, bool] = {}
+def _ownership_needs_network(link: str, github_username: str, cache: dict[str, bool]) -> bool:
+    """Whether is_original_repo(link) would have to ask GitHub."""
+    repo_ref = parse_github_repo(link) if link else None
+    if not repo_ref:
+        return False
+    if github_username and repo_ref[0].lower() != github_username.lower():
+        return False
+    return f"{repo_ref[0].lower()}/{repo_ref[1].lower()}" not in cache
 
-    for scan_path in cfg.scan_paths:
-        base = (root / scan_path).resolve()
-        if not base.exists() or not base.is_dir():
+
+def _needs_ownership_lookup(links: list[str], github_username: str, cache: dict[str, bool]) -> bool:
+    """Whether any link points at a repo under github_username with no verdict yet."""
+    return bool(github_username) and any(_ownership_needs_network(link, github_username, cache) for link in links)
+
+
+def confirm_ranked_originals(
+    candidates: list[Project],
+    preferred: list[tuple[str, Project]],
+    cfg: BuilderConfig,
+    cache: dict[str, bool],
+    client: GitHubClient,
+    stats: BuildStats,
+) -> tuple[list[Project], list[Project]]:
+    """The candidates that are not forks, and the preferred repos to add to them.
+
+    Checks go best local score first and stop once the rest cannot make the
+    top `max_projects`; those are dropped unchecked, as "ownership_pruned".
+    """
+    preferred_names = frozenset(cfg.preferred_projects)
+    requested = {normalize_name(name) for name, _ in preferred}
+    fallback_floor = max(4, cfg.max_projects // 2)
+    batch_size = GRAPHQL_BATCH_SIZE if client.graphql else max(1, cfg.network_workers)
+
+    def rank_key(project: Project) -> tuple[int, str]:
+        return -project_quality_score(project, preferred_names), project.name.lower()
+
+    order = sorted(range(len(candidates)), key=lambda index: (rank_key(candidates[index]), index))
+    by_key: dict[str, list[int]] = {}
+    for index, project in enumerate(candidates):
+        for key in _dedup_keys(project):
+            by_key.setdefault(key, []).append(index)
+
+    urgent = [index for index, project in enumerate(candidates) if project.normalized_name in requested]
+
+    def claim(project: Project) -> None:
+        for key in _dedup_keys(project):
+            urgent.extend(by_key.pop(key, ()))
+
+    for _, project in preferred:
+        claim(project)
+
+    verdicts: dict[int, bool] = {}
+    position = 0
+    while True:
+        urgent = [index for index in dict.fromkeys(urgent) if index not in verdicts]
+        while position < len(order) and order[position] in verdicts:
+            position += 1
+        if not urgent and position == len(order):
+            break
+        kept = [candidates[index] for index in sorted(verdicts) if verdicts[index]]
+        present = {project.normalized_name for project in kept}
+        extra = [project for name, project in preferred if normalize_name(name) not in present]
+        if not urgent and len(kept) + len(extra) >= max(fallback_floor, cfg.max_projects):
+            bound = rank_key(candidates[order[position]])
+            placed = sum(1 for project in deduplicate_projects(kept + extra) if rank_key(project) < bound)
+            if placed >= cfg.max_projects:
+                break
+
+        batch = urgent[:batch_size]
+        for index in order[position:]:
+            if len(batch) >= batch_size:
+                break
+            if index not in verdicts and index not in batch:
+                batch.append(index)
+        links = [candidates[index].link for index in batch]
+        networked = any(_ownership_needs_network(link, cfg.github_username, cache) for link in links)
+        answers = resolve_ownership(links, cfg.github_username, cache, cfg.network_workers if networked else 1, client)
+        for index, link in zip(batch, links):
+            verdicts[index] = not link or answers[link]
+            if verdicts[index]:
+                claim(candidates[index])
+            else:
+                stats.count("dropped_fork")
+
+    stats.count("ownership_pruned", len(candidates) - len(verdicts))
+    kept = [candidates[index] for index in sorted(verdicts) if verdicts[index]]
+    present = {project.normalized_name for project in kept}
+    return kept, [project for name, project in preferred if normalize_name(name) not in present]
+
+
+def _fetch_all_preferred(cfg: BuilderConfig, client: GitHubClient, stats: BuildStats) -> list[tuple[str, Project]]:
+    with stats.stage("preferred", network=True):
+        wanted = [name.strip() for name in cfg.preferred_projects if name.strip()]
+        return fetch_preferred_github_projects(cfg, wanted, client)
+
+
+def _prefetch_owned_listing(
+    cfg: BuilderConfig,
+    client: GitHubClient,
+    links: list[str],
+    ownership_cache: dict[str, bool],
+    stats: BuildStats,
+) -> list[object] | None:
+    """Prefill ownership verdicts from the owned-repos listing, when any link needs one.
+
+    Returns the listing so the owned-repos fallback can reuse it, or None
+    when it was not fetched.
+    """
+    if not (cfg.prefetch_owned_repos and _needs_ownership_lookup(links, cfg.github_username, ownership_cache)):
+        return None
+    with stats.stage("owned_prefetch", network=True):
+        # ceil(repos / 100) listing pages instead of one request per checkout.
+        owned_repos = [repo for page in owned_repos_pages(cfg, client) for repo in page]
+        stats.count("ownership_listed", prefill_ownership_from_listing(owned_repos, cfg.github_username, ownership_cache))
+    return owned_repos
+
+
+def collect_projects(
+    root: Path,
+    cfg: BuilderConfig,
+    client: GitHubClient | None = None,
+    manifest: ReadmeManifest | None = None,
+    stats: BuildStats | None = None,
+) -> list[Project]:
+    """Return the ranked projects for the site; GitHub requests that do not need README
+    contents run on background threads while the READMEs are analyzed."""
+    if client is None:
+        stats = stats or BuildStats()
+        client = GitHubClient(stats=stats, scheduler=_default_client().scheduler)
+        try:
+            return collect_projects(root, cfg, client, manifest, stats)
+        finally:
+            client.close()
+    stats = stats or client.stats
+    links: list[str] = []
+    ownership_cache: dict[str, bool] = dict.fromkeys(cfg.known_forks, False)
+
+    with stats.stage("scan"):
+        found = scan_readmes(root, cfg, stats)
+    for name, readme in found:
+        origin, verdict = local_repo_ownership(readme.parent, cfg.github_username)
+        link = resolve_repo_link(name, cfg, origin)
+        repo_ref = parse_github_repo(link) if verdict is False and link == origin else None
+        if repo_ref:
+            ownership_cache[f"{repo_ref[0].lower()}/{repo_ref[1].lower()}"] = False
+            stats.count("ownership_local")
+        links.append(link)
+
+    if client.offline or not cfg.github_username:
+        # Cache-only, or no account to ask about: nothing worth overlapping.
+        with stats.stage("readmes"):
+            analyzed = analyze_readmes(found, cfg.jobs, manifest, stats)
+        preferred_projects = _fetch_all_preferred(cfg, client, stats)
+        owned_repos = _prefetch_owned_listing(cfg, client, links, ownership_cache, stats)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as background:
+            preferred = background.submit(_fetch_all_preferred, cfg, client, stats)
+            listing = background.submit(_prefetch_owned_listing, cfg, client, links, ownership_cache, stats)
+            with stats.stage("readmes"):
+                analyzed = analyze_readmes(found, cfg.jobs, manifest, stats)
+            owned_repos = listing.result()
+            preferred_projects = preferred.result()
+
+    candidates = [
+        Project(name=name, description=summary, link=link, skills=skills)
+        for (name, _), link, (summary, skills) in zip(found, links, analyzed)
+    ]
+    with stats.stage("ownership", network=True):
+        kept, extra = confirm_ranked_originals(candidates, preferred_projects, cfg, ownership_cache, client, stats)
+    projects = kept + extra
+    if len(projects) < max(4, cfg.max_projects // 2):
+        with stats.stage("owned_listing", network=True):
+            projects.extend(collect_owned_github_projects(cfg, client, owned_repos))
+
+    with stats.stage("dedup"):
+        deduped = deduplicate_projects(projects)
+    stats.count("dropped_dedup", len(projects) - len(deduped))
+    with stats.stage("rank"):
+        ranked = rank_projects(deduped, cfg)
+    stats.count("dropped_rank_cutoff", len(deduped) - len(ranked))
+    return ranked
+
+
+def write_output(
+    root: Path,
+    projects: list[Project],
+    force: bool = False,
+    stats: BuildStats | None = None,
+) -> Path:
+    """Atomically write src/generated/projects.ts, leaving it untouched when only generatedAt
+    would change unless `force` is set."""
+    stats = stats or BuildStats()
+    output_path = root / "src" / "generated" / "projects.ts"
+    serialized_projects = json.dumps([project.as_dict() for project in projects], indent=2)
+    body = f"export const generatedProjects = {serialized_projects} as const;\n"
+    if not force:
+        try:
+            existing = output_path.read_text(encoding="utf-8")
+        except OSError:
+            existing = ""
+        header, separator, existing_body = existing.partition("\n\n")
+        if separator and header.startswith("export const generatedAt = ") and existing_body == body:
+            stats.count("output_unchanged")
+            return output_path
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    generated_at = datetime.now(timezone.utc).isoformat()
+    content = f"export const generatedAt = {json.dumps(generated_at)};\n\n{body}"
+    try:
+        mode = output_path.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644  # mkstemp files are 0600; the module must stay readable
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    stats.count("output_written")
+    return output_path
+
+
+def watch_snapshot(root: Path, cfg: BuilderConfig, config_path: Path) -> dict[str, tuple[int, int]]:
+    """(mtime_ns, size) of the config file and every README scan_readmes would use."""
+    snapshot: dict[str, tuple[int, int]] = {}
+    for path in [config_path, *(readme for _, readme in scan_readmes(root, cfg))]:
+        try:
+            stat = path.stat()
+        except OSError:
             continue
+        snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
 
-        for child in sorted(base.iterdir(), key=lambda item: item.name.lower()):
-            if not child.is_dir():
-                continue
-            if child.name.startswith("."):
-                continue
-            child_name = normalize_name(child.name)
-            if child_name in cfg.skip_projects:
-                continue
-            if child_name == this_repo_name:
-                continue
-            if child_name in cfg.exclude_projects:
-                continue
 
-            readme = find_readme(child)
-            if not readme:
-                continue
+class _Inotify:
+    """Just enough of Linux inotify (through libc) to wake the watch loop early."""
 
-            content = readme.read_text(encoding="utf-8", errors="ignore")
-            summary = summarize_readme(content)
-            skills = infer_skills(child.name, content)
-            link = resolve_repo_link(child.name, cfg)
+    # IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
 
-            if link and not is_original_repo(link, cfg.github_username, ownership_cache):
-                continue
+    def __init__(self) -> None:
+        import ctypes
+        import ctypes.util
 
-            projects.append(
-                {
-                    "name": child.name,
-                    "description": summary,
-                    "link": link,
-                    "skills": skills,
-                }
-            )
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
 
-    projects.extend(collect_preferred_github_projects(cfg, projects))
+    def watch(self, directories: Iterable[Path]) -> None:
+        for directory in directories:
+            # Re-adding a watched directory just returns its existing watch.
+            self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
 
-    if len(projects) < max(4, cfg.max_projects // 2):
-        projects.extend(collect_owned_github_projects(cfg))
+    def wait(self, timeout: float) -> bool:
+        import select
 
-    deduped = deduplicate_projects(projects, cfg.max_projects * 3)
-    return rank_projects(deduped, cfg)
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        return True
 
+    def close(self) -> None:
+        os.close(self.fd)
 
-def write_output(root: Path, projects: list[dict[str, object]]) -> Path:
-    output_path = root / "src" / "generated" / "projects.ts"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    generated_at = datetime.now(timezone.utc).isoformat()
-    serialized_projects = json.dumps(projects, indent=2)
-    content = (
-        f"export const generatedAt = {json.dumps(generated_at)};\n\n"
-        f"export const generatedProjects = {serialized_projects} as const;\n"
-    )
-    output_path.write_text(content, encoding="utf-8")
-    return output_path
+
+def watch_projects(
+    root: Path,
+    config_path: Path,
+    cfg: BuilderConfig,
+    rebuild: Callable[[BuilderConfig], None],
+    stop: threading.Event | None = None,
+    interval: float = WATCH_INTERVAL,
+    debounce: float = WATCH_DEBOUNCE,
+    use_inotify: bool = True,
+) -> None:
+    """Call rebuild(cfg) whenever a README under scan_paths or the config changes, until `stop`
+    is set; load and rebuild errors are reported on stderr and watching continues."""
+    stop = stop or threading.Event()
+    notifier = None
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            notifier = _Inotify()
+        except (OSError, AttributeError):
+            notifier = None
+
+    def wait(timeout: float) -> bool:
+        if notifier is None:
+            stop.wait(timeout)
+            return False
+        return notifier.wait(timeout)
+
+    def add_watches(snapshot: dict[str, tuple[int, int]]) -> None:
+        if notifier is not None:
+            bases = [(root / scan_path).resolve() for scan_path in cfg.scan_paths]
+            notifier.watch([config_path.parent, *bases, *(Path(path).parent for path in snapshot)])
+
+    previous = watch_snapshot(root, cfg, config_path)
+    add_watches(previous)
+    try:
+        while not stop.is_set():
+            wait(interval)
+            current = watch_snapshot(root, cfg, config_path)
+            if current == previous:
+                continue
+            # Debounce: wait until a check finds nothing new since the last one.
+            while not stop.is_set():
+                wait(debounce)
+                settled = watch_snapshot(root, cfg, config_path)
+                if settled == current:
+                    break
+                current = settled
+            if stop.is_set():
+                break
+            if current.get(str(config_path)) != previous.get(str(config_path)):
+                try:
+                    cfg = replace(load_config(root, config_path), jobs=cfg.jobs)
+                except (ValueError, OSError) as exc:
+                    print(f"warning: keeping the previous config; cannot load {config_path}: {exc}", file=sys.stderr)
+                else:
+                    current = watch_snapshot(root, cfg, config_path)
+            previous = current
+            add_watches(current)
+            try:
+                rebuild(cfg)
+            except (ValueError, OSError) as exc:
+                print(f"error: rebuild failed, still watching: {exc}", file=sys.stderr)
+    finally:
+        if notifier is not None:
+            notifier.close()
 
 
 def main() -> None:
@@ -500,6 +2099,62 @@ def main() -> None:
         default="portfolio_builder.json",
         help="Path to builder config JSON (relative to root unless absolute)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for README parsing and skill inference (default: jobs from config, else 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk GitHub response cache",
+    )
+    parser.add_argument(
+        "--full-rescan",
+        action="store_true",
+        help=f"Re-parse every README instead of reusing unchanged ones from {MANIFEST_NAME}",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Revalidate every cached GitHub response regardless of cache_ttl_seconds",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Make no network requests: use cached GitHub responses of any age and keep repos that cannot be checked",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop asking GitHub after SECONDS per build; later lookups use cached or default answers",
+    )
+    parser.add_argument(
+        "--force-write",
+        action="store_true",
+        help="Rewrite projects.ts even when only its generatedAt timestamp would change",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print wall time per stage, HTTP/cache counters and how many projects each filter dropped",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="PATH",
+        help="Also write the --profile breakdown as JSON to PATH",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="PATH",
+        help="Run the pipeline under cProfile and save the stats to PATH (view with `python -m pstats PATH`)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the first build, rebuild whenever a README under scan_paths or the config changes",
+    )
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
@@ -508,10 +2163,74 @@ def main() -> None:
         config_path = root / config_path
 
     cfg = load_config(root, config_path)
-    projects = collect_projects(root, cfg)
-    output = write_output(root, projects)
+    for normalized, keys in cfg.project_github_collisions.items():
+        print(
+            f"warning: project_github keys {', '.join(map(repr, keys))} all normalize to {normalized!r}; "
+            f"using {keys[0]!r}",
+            file=sys.stderr,
+        )
+    if args.jobs is not None:
+        cfg = replace(cfg, jobs=max(1, args.jobs))
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(root / CACHE_DIR / "github-responses.json", cfg.cache_ttl_seconds, refresh=args.refresh)
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or ""
+    client = GitHubClient(
+        cache=cache,
+        token=token,
+        graphql=cfg.github_graphql,
+        max_connections=cfg.network_workers,
+        scheduler=RateLimitScheduler(max_wait=cfg.rate_limit_max_wait),
+        offline=args.offline,
+    )
+    manifest = ReadmeManifest(root / "src" / "generated" / MANIFEST_NAME, reuse=not args.full_rescan)
+
+    def build(cfg: BuilderConfig) -> None:
+        stats = client.stats = BuildStats()
+        client.deadline = time.monotonic() + args.deadline if args.deadline is not None else None
+        projects = collect_projects(root, cfg, client, manifest, stats)
+        with stats.stage("write_output"):
+            output = write_output(root, projects, force=args.force_write, stats=stats)
+            manifest.save()
+        manifest.rollover()
+        if client.cache:
+            client.cache.save()
+
+        if stats.counters.get("output_unchanged"):
+            print(f"{len(projects)} projects unchanged; left {output} as is", flush=True)
+        else:
+            print(f"Generated {len(projects)} projects at {output}", flush=True)
+        if stats.degraded:
+            print(
+                f"warning: --deadline {args.deadline:g}s ran out; {', '.join(stats.degraded)} used cached or default "
+                f"answers for {stats.counters['deadline_skipped']} GitHub lookups",
+                file=sys.stderr,
+            )
+        if args.profile or args.profile_json:
+            print(stats.report())
+        if args.profile_json:
+            Path(args.profile_json).write_text(json.dumps(stats.as_dict(), indent=2) + "\n", encoding="utf-8")
+
+    profiler = None
+    if args.cprofile:
+        import cProfile
 
-    print(f"Generated {len(projects)} projects at {output}")
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        build(cfg)
+        if args.watch:
+            print(f"Watching {', '.join(cfg.scan_paths)} for README changes (Ctrl+C to stop)", flush=True)
+            try:
+                watch_projects(root, config_path, cfg, build)
+            except KeyboardInterrupt:
+                pass
+    finally:
+        client.close()
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+            print(f"cProfile stats written to {args.cprofile}")
 
 
 if __name__ == "__main__":
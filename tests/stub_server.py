@@ -0,0 +1,79 @@
+"""Local HTTP server scaffolding shared by the network tests and benchmarks/fake_github.py.
+
+StubServer runs a ThreadingHTTPServer on 127.0.0.1 in a daemon thread while
+used as a context manager; subclasses answer requests by overriding do_GET /
+do_POST, which receive the request handler. `api_base` is the server's own
+address.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def send_json(handler, status, payload, headers=None):
+    body = json.dumps(payload).encode("utf-8")
+    handler.send_response(status)
+    handler.send_header("Content-Type", "application/json")
+    handler.send_header("Content-Length", str(len(body)))
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+class StubServer:
+    # HTTP/1.1 keeps connections open between requests; 1.0 closes each one.
+    keep_alive = False
+
+    def __init__(self):
+        self.connections = 0
+        self._count_lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1" if stub.keep_alive else "HTTP/1.0"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                stub.connected()
+                super().setup()
+
+            def handle(self):
+                try:
+                    super().handle()
+                except ConnectionError:
+                    pass  # the client gave up before the response was written
+
+            def do_GET(self):
+                stub.do_GET(self)
+
+            def do_POST(self):
+                stub.do_POST(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.api_base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    def connected(self):
+        """Called on the handler thread for every new connection."""
+        with self._count_lock:
+            self.connections += 1
+
+    def do_GET(self, handler):
+        send_json(handler, 404, {"message": "Not Found"})
+
+    def do_POST(self, handler):
+        send_json(handler, 404, {"message": "Not Found"})
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -12,6 +12,7 @@ Run with either:
 
 import hashlib
 import json
+import os
 import pathlib
 import sys
 import tempfile
@@ -83,6 +84,23 @@ class LoadConfigTests(unittest.TestCase):
         self.assertEqual(cfg.preferred_projects, [])
         self.assertEqual(cfg.project_github, {})
         self.assertEqual(cfg.github_username, "")
+        self.assertEqual(cfg.network_workers, 8)
+
+    def test_load_config_rejects_wrong_types(self):
+        bad = [
+            {"max_projects": None},
+            {"github_username": 5},
+            {"project_github": ["viken/x"]},
+            {"scan_paths": [3]},
+            {"github_graphql": "yes"},
+            ["not", "an", "object"],
+        ]
+        with tempfile.TemporaryDirectory() as d:
+            cfg_path = pathlib.Path(d) / "cfg.json"
+            for raw in bad:
+                cfg_path.write_text(json.dumps(raw), encoding="utf-8")
+                with self.assertRaises(ValueError, msg=raw):
+                    pb.load_config(pathlib.Path(d), cfg_path)
 
     def test_load_config_coerces_and_normalizes(self):
         with tempfile.TemporaryDirectory() as d:
@@ -106,6 +124,21 @@ class LoadConfigTests(unittest.TestCase):
         self.assertEqual(cfg.skip_projects, {"skip-me"})
         self.assertEqual(cfg.preferred_projects, ["pref-project"])
 
+    def test_load_config_known_forks_accepts_names_refs_and_urls(self):
+        with tempfile.TemporaryDirectory() as d:
+            cfg_path = pathlib.Path(d) / "cfg.json"
+            cfg_path.write_text(
+                json.dumps(
+                    {
+                        "github_username": "Viken",
+                        "known_forks": ["Bare-Name", "Other/Repo", "https://github.com/viken/Cloned.git", " "],
+                    }
+                ),
+                encoding="utf-8",
+            )
+            cfg = pb.load_config(pathlib.Path(d), cfg_path)
+        self.assertEqual(cfg.known_forks, {"viken/bare-name", "other/repo", "viken/cloned"})
+
 
 class SummarizeReadmeTests(unittest.TestCase):
     def test_summarize_readme_basic_paragraph(self):
@@ -194,6 +227,21 @@ class ResolveRepoLinkTests(unittest.TestCase):
         cfg = _make_cfg()
         self.assertEqual(pb.resolve_repo_link("Other", cfg), "")
 
+    def test_project_github_index_reports_collisions(self):
+        cfg = _make_cfg(
+            project_github={"My Proj": "https://x/first", "my_proj": "https://x/second", "Other": "https://x/o"}
+        )
+        self.assertEqual(cfg.project_github_index["my-proj"], "https://x/first")
+        self.assertEqual(cfg.project_github_collisions, {"my-proj": ["My Proj", "my_proj"]})
+        # Exact keys still win over the normalized index.
+        self.assertEqual(pb.resolve_repo_link("my_proj", cfg), "https://x/second")
+        self.assertEqual(pb.resolve_repo_link("MY-PROJ", cfg), "https://x/first")
+
+    def test_project_github_index_follows_replace(self):
+        cfg = pb.replace(_make_cfg(project_github={"A": "https://x/a"}), project_github={"B b": "https://x/b"})
+        self.assertEqual(pb.resolve_repo_link("b-b", cfg), "https://x/b")
+        self.assertEqual(pb.resolve_repo_link("a", cfg), "")
+
 
 class ParseGithubRepoTests(unittest.TestCase):
     def test_parse_github_repo_valid_and_git_suffix(self):
@@ -222,49 +270,44 @@ class IsBackupLikeNameTests(unittest.TestCase):
 class DeduplicateProjectsTests(unittest.TestCase):
     def test_deduplicate_prefers_non_backup_and_richer(self):
         projects = [
-            {
-                "name": "Proj-backup-20240101",
-                "description": "short",
-                "link": "",
-                "skills": ["A"],
-            },
-            {
-                "name": "Proj",
-                "description": "a much longer richer description here for sure",
-                "link": "",
-                "skills": ["A", "B", "C"],
-            },
+            pb.Project(name="Proj-backup-20240101", description="short", link="", skills=["A"]),
+            pb.Project(
+                name="Proj",
+                description="a much longer richer description here for sure",
+                link="",
+                skills=["A", "B", "C"],
+            ),
         ]
         deduped = pb.deduplicate_projects(projects, 24)
         # Both share canonical key "proj" -> collapse to one; the non-backup,
         # richer entry wins.
         self.assertEqual(len(deduped), 1)
-        self.assertEqual(deduped[0]["name"], "Proj")
+        self.assertEqual(deduped[0].name, "Proj")
 
     def test_deduplicate_sorted_and_capped(self):
         projects = [
-            {"name": "Zeta", "description": "", "link": "", "skills": []},
-            {"name": "Alpha", "description": "", "link": "", "skills": []},
-            {"name": "Mu", "description": "", "link": "", "skills": []},
+            pb.Project(name="Zeta", description="", link="", skills=[]),
+            pb.Project(name="Alpha", description="", link="", skills=[]),
+            pb.Project(name="Mu", description="", link="", skills=[]),
         ]
         deduped = pb.deduplicate_projects(projects, 2)
         self.assertEqual(len(deduped), 2)
         # Sorted by lowercased name before the cap.
-        self.assertEqual([p["name"] for p in deduped], ["Alpha", "Mu"])
+        self.assertEqual([p.name for p in deduped], ["Alpha", "Mu"])
 
 
 class ProjectQualityScoreTests(unittest.TestCase):
     def test_project_quality_score_preferred_boost(self):
         preferred = pb.project_quality_score(
-            {"name": "Pref", "description": "", "skills": [], "link": ""}, ["pref"]
+            pb.Project(name="Pref", description="", link="", skills=[]), ["pref"]
         )
         non_preferred = pb.project_quality_score(
-            {
-                "name": "Other",
-                "description": "d" * 220,
-                "skills": ["AI", "LLMs", "RAG", "Backend", "DevOps", "Full Stack"],
-                "link": "https://github.com/x/y",
-            },
+            pb.Project(
+                name="Other",
+                description="d" * 220,
+                link="https://github.com/x/y",
+                skills=["AI", "LLMs", "RAG", "Backend", "DevOps", "Full Stack"],
+            ),
             ["pref"],
         )
         self.assertGreaterEqual(preferred, 1000)
@@ -274,7 +317,7 @@ class ProjectQualityScoreTests(unittest.TestCase):
 class RankProjectsTests(unittest.TestCase):
     def test_rank_projects_respects_max(self):
         projects = [
-            {"name": f"p{i}", "description": "", "link": "", "skills": []}
+            pb.Project(name=f"p{i}", description="", link="", skills=[])
             for i in range(10)
         ]
         cfg = _make_cfg(max_projects=3)
@@ -283,17 +326,39 @@ class RankProjectsTests(unittest.TestCase):
 
     def test_rank_projects_highest_score_first(self):
         projects = [
-            {"name": "low", "description": "", "link": "", "skills": []},
-            {
-                "name": "high",
-                "description": "d" * 100,
-                "skills": ["AI", "Backend"],
-                "link": "https://github.com/x/y",
-            },
+            pb.Project(name="low", description="", link="", skills=[]),
+            pb.Project(name="high", description="d" * 100, link="https://github.com/x/y", skills=["AI", "Backend"]),
         ]
         cfg = _make_cfg(max_projects=24)
         ranked = pb.rank_projects(projects, cfg)
-        self.assertEqual(ranked[0]["name"], "high")
+        self.assertEqual(ranked[0].name, "high")
+
+    def test_rank_projects_matches_full_sort(self):
+        skills = ["AI", "LLMs", "Backend", "Python", "Java", "AWS", "RAG"]
+        projects = [
+            pb.Project(
+                name=f"p{(i * 37) % 200:03d}",
+                description="d" * ((i * 53) % 260),
+                link="https://github.com/x/y" if i % 3 else "",
+                skills=skills[: i % 8],
+            )
+            for i in range(200)
+        ]
+        cfg = _make_cfg(max_projects=7, preferred_projects=["p150"])
+        full_sort = sorted(
+            projects,
+            key=lambda p: (-pb.project_quality_score(p, cfg.preferred_projects), p.name.lower()),
+        )
+        self.assertEqual(pb.rank_projects(projects, cfg), full_sort[:7])
+        self.assertEqual(pb.rank_projects(projects, _make_cfg(max_projects=0)), [])
+
+    def test_dedup_without_cap_keeps_late_high_scorers(self):
+        # Name-sorted truncation used to drop "zz-best" before it was scored.
+        projects = [pb.Project(name=f"a{i:02d}", description="", link="", skills=[]) for i in range(30)]
+        projects.append(pb.Project(name="zz-best", description="d" * 200, link="", skills=["AI", "RAG"]))
+        deduped = pb.deduplicate_projects(projects)
+        self.assertEqual(len(deduped), 31)
+        self.assertEqual(pb.rank_projects(deduped, _make_cfg(max_projects=5))[0].name, "zz-best")
 
 
 class WriteOutputTests(unittest.TestCase):
@@ -301,12 +366,7 @@ class WriteOutputTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as d:
             tmp_root = pathlib.Path(d)
             projects = [
-                {
-                    "name": "Demo",
-                    "description": "A demo project.",
-                    "link": "https://github.com/x/demo",
-                    "skills": ["Backend"],
-                }
+                pb.Project(name="Demo", description="A demo project.", link="https://github.com/x/demo", skills=["Backend"])
             ]
             out = pb.write_output(tmp_root, projects)
             expected = tmp_root / "src" / "generated" / "projects.ts"
@@ -317,6 +377,43 @@ class WriteOutputTests(unittest.TestCase):
             self.assertIn("as const", text)
             self.assertIn("generatedAt", text)
 
+    PROJECTS = [pb.Project(name="Demo", description="A demo project.", link="", skills=["Backend"])]
+
+    def test_unchanged_projects_leave_file_untouched(self):
+        with tempfile.TemporaryDirectory() as d:
+            tmp_root = pathlib.Path(d)
+            out = pb.write_output(tmp_root, self.PROJECTS)
+            before = out.read_bytes()
+            os.utime(out, ns=(0, 0))
+            stats = pb.BuildStats()
+            pb.write_output(tmp_root, [pb.Project(**p.as_dict()) for p in self.PROJECTS], stats=stats)
+            self.assertEqual(out.read_bytes(), before)
+            self.assertEqual(out.stat().st_mtime_ns, 0)
+            self.assertEqual(stats.counters, {"output_unchanged": 1})
+
+            pb.write_output(tmp_root, self.PROJECTS, force=True)
+            self.assertNotEqual(out.stat().st_mtime_ns, 0)
+
+    def test_changed_projects_are_written_atomically(self):
+        with tempfile.TemporaryDirectory() as d:
+            tmp_root = pathlib.Path(d)
+            out = pb.write_output(tmp_root, self.PROJECTS)
+            out.chmod(0o640)
+            pb.write_output(tmp_root, self.PROJECTS + [pb.Project(name="New", description="", link="", skills=[])])
+            self.assertIn('"New"', out.read_text(encoding="utf-8"))
+            self.assertEqual(out.stat().st_mode & 0o777, 0o640)
+            self.assertEqual([p.name for p in out.parent.iterdir()], ["projects.ts"])
+
+    def test_foreign_file_is_replaced(self):
+        with tempfile.TemporaryDirectory() as d:
+            tmp_root = pathlib.Path(d)
+            out = tmp_root / "src" / "generated" / "projects.ts"
+            out.parent.mkdir(parents=True)
+            body = f"export const generatedProjects = {json.dumps([p.as_dict() for p in self.PROJECTS], indent=2)} as const;\n"
+            out.write_text(body, encoding="utf-8")
+            pb.write_output(tmp_root, self.PROJECTS)
+            self.assertTrue(out.read_text(encoding="utf-8").startswith("export const generatedAt = "))
+
 
 if __name__ == "__main__":
     unittest.main()
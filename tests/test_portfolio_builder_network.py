@@ -0,0 +1,676 @@
+"""Network-path tests for scripts/portfolio_builder.py against a local stub server.
+
+Every request goes to a ThreadingHTTPServer bound to 127.0.0.1 that mimics the
+handful of GitHub REST endpoints the builder uses; GitHubClient is pointed at it
+through `api_base`. Nothing reaches api.github.com and nothing is written
+outside a TemporaryDirectory.
+
+Run with either:
+    python3 -m unittest discover -s tests -v
+    pytest tests/
+"""
+
+import json
+import pathlib
+import re
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "scripts"))
+import portfolio_builder as pb  # noqa: E402
+from stub_server import StubServer, send_json  # noqa: E402
+
+
+def _make_cfg(**overrides):
+    defaults = dict(
+        scan_paths=[],
+        skip_projects=set(),
+        exclude_projects=set(),
+        github_username="viken",
+        project_github={},
+        max_projects=24,
+        preferred_projects=[],
+        github_fallback_limit=30,
+    )
+    defaults.update(overrides)
+    return pb.BuilderConfig(**defaults)
+
+
+class StubGitHub(StubServer):
+    """Serves `routes` (path -> JSON payload) with ETags and records every request.
+
+    `headers` maps a path to extra response headers; "{base}" in a value is
+    replaced with the server's own address (for Link headers). POST /graphql
+    answers aliased `repository(owner:, name:)` queries from the same
+    /repos/{owner}/{name} routes and requires an Authorization header.
+    """
+
+    def __init__(self, routes, headers=None):
+        super().__init__()
+        self.routes = routes
+        self.headers = headers or {}
+        self.requests = []
+
+    def do_GET(self, handler):
+        self.requests.append((handler.path, dict(handler.headers)))
+        payload = self.routes.get(handler.path)
+        if payload is None:
+            handler.send_response(404)
+            handler.end_headers()
+            return
+        etag = f'"{abs(hash(json.dumps(payload, sort_keys=True)))}"'
+        if handler.headers.get("If-None-Match") == etag:
+            handler.send_response(304)
+            handler.send_header("ETag", etag)
+            handler.end_headers()
+            return
+        extra = {name: value.replace("{base}", self.api_base) for name, value in self.headers.get(handler.path, {}).items()}
+        send_json(handler, 200, payload, {"ETag": etag, **extra})
+
+    def do_POST(self, handler):
+        body = handler.rfile.read(int(handler.headers.get("Content-Length", 0)))
+        self.requests.append((handler.path, dict(handler.headers)))
+        if handler.path != "/graphql" or not handler.headers.get("Authorization"):
+            handler.send_response(401)
+            handler.end_headers()
+            return
+        query = json.loads(body)["query"]
+        data, errors = {}, []
+        for alias, owner, name in re.findall(r'(\w+): repository\(owner: "([^"]+)", name: "([^"]+)"\)', query):
+            repo = self.routes.get(f"/repos/{owner}/{name}")
+            if repo is None:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias]})
+                continue
+            data[alias] = {
+                "name": repo["name"],
+                "isFork": repo.get("fork", False),
+                "description": repo.get("description"),
+                "url": repo.get("html_url", f"https://github.com/{owner}/{repo['name']}"),
+                "primaryLanguage": {"name": repo["language"]} if repo.get("language") else None,
+                "repositoryTopics": {"nodes": [{"topic": {"name": t}} for t in repo.get("topics", [])]},
+            }
+        send_json(handler, 200, {"data": data, "errors": errors} if errors else {"data": data})
+
+    def paths(self):
+        return [path for path, _ in self.requests]
+
+
+REPOS = {
+    "/repos/viken/original": {"name": "original", "fork": False},
+    "/repos/viken/forked": {"name": "forked", "fork": True},
+}
+
+
+class IsOriginalRepoStubTests(unittest.TestCase):
+    def test_fork_flag_decides_verdict(self):
+        with StubGitHub(REPOS) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base)
+            cache = {}
+            self.assertTrue(pb.is_original_repo("https://github.com/viken/original", "viken", cache, client))
+            self.assertFalse(pb.is_original_repo("https://github.com/viken/forked", "viken", cache, client))
+        self.assertEqual(cache, {"viken/original": True, "viken/forked": False})
+
+    def test_parallel_resolution_matches_serial(self):
+        links = [f"https://github.com/viken/{name}" for name in ("original", "forked", "missing", "original")]
+        with StubGitHub(REPOS) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base)
+            serial = pb.resolve_ownership(links, "viken", {}, workers=1, client=client)
+            parallel = pb.resolve_ownership(links, "viken", {}, workers=4, client=client)
+        self.assertEqual(serial, parallel)
+        self.assertFalse(parallel["https://github.com/viken/forked"])
+
+    def test_lookups_without_a_client_share_one(self):
+        with StubGitHub(REPOS) as stub:
+            shared = pb.GitHubClient(api_base=stub.api_base)
+            saved, pb._DEFAULT_CLIENT = pb._DEFAULT_CLIENT, shared
+            pools = lambda: sum(thread.name == "github-http" for thread in threading.enumerate())  # noqa: E731
+            before = pools()
+            try:
+                for _ in range(20):
+                    self.assertTrue(pb.is_original_repo("https://github.com/viken/original", "viken", {}))
+                    pb.resolve_ownership(["https://github.com/viken/forked"], "viken", {}, workers=1)
+                # One event-loop thread for the shared pool, not one per call.
+                self.assertEqual(pools(), before + 1)
+            finally:
+                pb._DEFAULT_CLIENT = saved
+                shared.close()
+        self.assertEqual(shared.stats.counters["http_requests"], 40)
+
+    def test_stats_count_requests_and_cache_hits(self):
+        links = [f"https://github.com/viken/{name}" for name in ("original", "forked", "missing")]
+        stats = pb.BuildStats()
+        with StubGitHub(REPOS) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base, stats=stats)
+            cache = {}
+            pb.resolve_ownership(links, "viken", cache, workers=2, client=client)
+            pb.resolve_ownership(links, "viken", cache, workers=2, client=client)
+        self.assertEqual(stats.counters["ownership_lookups"], 3)
+        self.assertEqual(stats.counters["ownership_cache_hits"], 3)
+        self.assertEqual(stats.counters["http_requests"], 3)
+        self.assertEqual(stats.counters["http_not_found"], 1)
+
+
+OWNED_PATH = "/users/viken/repos?type=owner&sort=updated&per_page=100"
+
+
+def _owned_listing(total, per_page=100):
+    """Routes + Link headers for `total` owned repos; every 10th one is a fork."""
+    repos = [{"name": f"repo-{i:03d}", "fork": i % 10 == 9, "description": f"repo {i}"} for i in range(total)]
+    pages = [repos[start : start + per_page] for start in range(0, total, per_page)] or [[]]
+    routes, headers = {}, {}
+    for number, page in enumerate(pages, start=1):
+        path = OWNED_PATH if number == 1 else f"{OWNED_PATH}&page={number}"
+        routes[path] = page
+        if len(pages) > 1:
+            last = f"<{{base}}{OWNED_PATH}&page={len(pages)}>; rel=\"last\""
+            nxt = f"<{{base}}{OWNED_PATH}&page={number + 1}>; rel=\"next\", " if number < len(pages) else ""
+            headers[path] = {"Link": nxt + last}
+    return routes, headers
+
+
+class OwnedRepoPaginationTests(unittest.TestCase):
+    def test_all_pages_are_collected_in_order(self):
+        routes, headers = _owned_listing(250)
+        with StubGitHub(routes, headers) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base)
+            projects = pb.collect_owned_github_projects(_make_cfg(github_fallback_limit=1000, network_workers=4), client)
+        expected = [f"repo-{i:03d}" for i in range(250) if i % 10 != 9]
+        self.assertEqual([p.name for p in projects], expected)
+        self.assertEqual(len(stub.requests), 3)
+
+    def test_stops_requesting_pages_once_limit_is_reached(self):
+        routes, headers = _owned_listing(450)
+        with StubGitHub(routes, headers) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base)
+            projects = pb.collect_owned_github_projects(_make_cfg(github_fallback_limit=120, network_workers=2), client)
+        self.assertEqual(len(projects), 120)
+        self.assertEqual(projects[-1].name, "repo-132")
+        # Page 1, then one batch of two pages; pages 4 and 5 are never requested.
+        self.assertEqual(sorted(stub.paths()), sorted([OWNED_PATH, f"{OWNED_PATH}&page=2", f"{OWNED_PATH}&page=3"]))
+
+    def test_next_links_are_followed_without_last(self):
+        routes, headers = _owned_listing(150)
+        headers = {path: {"Link": value["Link"].split(", <")[0]} for path, value in headers.items() if "next" in value["Link"]}
+        with StubGitHub(routes, headers) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base)
+            projects = pb.collect_owned_github_projects(_make_cfg(github_fallback_limit=1000), client)
+        self.assertEqual(len(projects), 135)
+
+    def test_listing_answers_fork_checks_for_collect_projects(self):
+        routes, headers = _owned_listing(250)
+        routes["/repos/viken/renamed"] = {"name": "renamed", "fork": False}
+        names = ["repo-000", "repo-009", "repo-123", "repo-249", "renamed"]
+        with tempfile.TemporaryDirectory() as d, StubGitHub(routes, headers) as stub:
+            base = pathlib.Path(d)
+            for name in names:
+                (base / name).mkdir()
+                (base / name / "README.md").write_text(f"{name} is a python service with a REST api.", encoding="utf-8")
+            (base / "site").mkdir()
+            stats = pb.BuildStats()
+            client = pb.GitHubClient(api_base=stub.api_base, stats=stats)
+            cfg = _make_cfg(scan_paths=[".."], max_projects=8, github_fallback_limit=2, network_workers=4)
+            projects = pb.collect_projects(base / "site", cfg, client)
+        names = {p.name for p in projects}
+        self.assertTrue({"renamed", "repo-000", "repo-123"} <= names)
+        self.assertFalse({"repo-009", "repo-249"} & names)  # forks per the listing
+        self.assertEqual(stats.counters["ownership_listed"], 250)
+        # Three listing pages plus one lookup for the repo the listing does not
+        # name; the owned_listing fallback reuses the pages already fetched.
+        self.assertIn("owned_listing", stats.stages)
+        self.assertEqual(sorted(stub.paths()), sorted([*routes][:3] + ["/repos/viken/renamed"]))
+
+    def test_parse_link_header(self):
+        value = '<https://api.github.com/x?page=2>; rel="next", <https://api.github.com/x?page=7>; rel="last"'
+        self.assertEqual(
+            pb.parse_link_header(value),
+            {"next": "https://api.github.com/x?page=2", "last": "https://api.github.com/x?page=7"},
+        )
+
+
+PREFERRED = {
+    "/repos/viken/edumind-ai": {
+        "name": "edumind-ai",
+        "fork": False,
+        "description": "Adaptive tutoring with RAG over course notes",
+        "language": "Python",
+        "topics": ["llm", "fastapi"],
+    },
+    "/repos/viken/forked-tool": {"name": "forked-tool", "fork": True},
+}
+
+
+class GraphQLBatchTests(unittest.TestCase):
+    def test_batch_answers_many_repos_in_one_query(self):
+        refs = [("viken", "edumind-ai"), ("viken", "forked-tool"), ("viken", "missing")]
+        with StubGitHub(PREFERRED) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base, token="t")
+            results = pb.fetch_repo_metadata_batch(client, refs)
+        self.assertEqual(stub.paths(), ["/graphql"])
+        self.assertEqual(results["viken/edumind-ai"]["topics"], ["llm", "fastapi"])
+        self.assertEqual(results["viken/edumind-ai"]["language"], "Python")
+        self.assertTrue(results["viken/forked-tool"]["fork"])
+        self.assertIsNone(results["viken/missing"])
+
+    def test_refs_are_chunked(self):
+        refs = [("viken", f"repo-{i}") for i in range(pb.GRAPHQL_BATCH_SIZE * 2 + 1)]
+        with StubGitHub({}) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base, token="t")
+            results = pb.fetch_repo_metadata_batch(client, refs, workers=3)
+        self.assertEqual(len(stub.requests), 3)
+        self.assertEqual(len(results), len(refs))
+
+    def test_fresh_cache_entries_skip_the_query(self):
+        refs = [("viken", "edumind-ai"), ("viken", "forked-tool"), ("viken", "missing")]
+        with tempfile.TemporaryDirectory() as d, StubGitHub(PREFERRED) as stub:
+            path = pathlib.Path(d) / "cache.json"
+            cold = pb.GitHubClient(api_base=stub.api_base, token="t", cache=pb.ResponseCache(path, ttl=3600))
+            first = pb.fetch_repo_metadata_batch(cold, refs)
+            cold.close()
+            warm = pb.GitHubClient(api_base=stub.api_base, token="t", cache=pb.ResponseCache(path, ttl=3600))
+            again = pb.fetch_repo_metadata_batch(warm, refs[:2])
+        # Only the cold run queried; NOT_FOUND answers are not cached, as with REST.
+        self.assertEqual(stub.paths(), ["/graphql"])
+        self.assertEqual(again, {key: first[key] for key in ("viken/edumind-ai", "viken/forked-tool")})
+        self.assertEqual(warm.stats.counters["http_cache_hits"], 2)
+
+    def test_no_token_means_no_batch(self):
+        with StubGitHub(PREFERRED) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base)
+            self.assertEqual(pb.fetch_repo_metadata_batch(client, [("viken", "edumind-ai")]), {})
+        self.assertEqual(stub.requests, [])
+
+    def test_ownership_resolved_without_rest_calls(self):
+        links = ["https://github.com/viken/edumind-ai", "https://github.com/viken/forked-tool", "https://github.com/viken/gone"]
+        with StubGitHub(PREFERRED) as stub:
+            client = pb.GitHubClient(api_base=stub.api_base, token="t")
+            verdicts = pb.resolve_ownership(links, "viken", {}, workers=4, client=client)
+        self.assertEqual(stub.paths(), ["/graphql"])
+        self.assertEqual(list(verdicts.values()), [True, False, True])
+
+    def test_preferred_projects_batched_and_rest_fallback_agree(self):
+        cfg = _make_cfg(preferred_projects=["edumind-ai", "forked-tool", "missing"])
+        with StubGitHub(PREFERRED) as stub:
+            batched = pb.collect_preferred_github_projects(cfg, [], pb.GitHubClient(api_base=stub.api_base, token="t"))
+            graphql_calls = len(stub.requests)
+            rest = pb.collect_preferred_github_projects(cfg, [], pb.GitHubClient(api_base=stub.api_base))
+        self.assertEqual(graphql_calls, 1)
+        self.assertEqual(batched, rest)
+        self.assertEqual([p.name for p in batched], ["edumind-ai"])
+        self.assertIn("RAG", batched[0].skills)
+
+
+class PipelinedCollectTests(unittest.TestCase):
+    ROUTES = {
+        "/repos/viken/edumind-ai": PREFERRED["/repos/viken/edumind-ai"],
+        "/repos/viken/new-one": {"name": "new-one", "fork": False, "description": "Only on GitHub"},
+        "/repos/viken/tool": {"name": "tool", "fork": False},
+        "/repos/viken/forked": {"name": "forked", "fork": True},
+    }
+
+    def test_speculative_preferred_fetch_is_filtered_after_the_scan(self):
+        with tempfile.TemporaryDirectory() as d, StubGitHub(self.ROUTES) as stub:
+            base = pathlib.Path(d)
+            for name in ("edumind_ai", "tool", "forked"):
+                (base / name).mkdir()
+                (base / name / "README.md").write_text(f"{name} is a python service with a REST api.", encoding="utf-8")
+            (base / "site").mkdir()
+            cfg = _make_cfg(scan_paths=[".."], preferred_projects=["edumind-ai", "new-one"], network_workers=4)
+            projects = pb.collect_projects(base / "site", cfg, pb.GitHubClient(api_base=stub.api_base))
+        by_name = {p.name: p for p in projects}
+        self.assertEqual(sorted(by_name), ["edumind_ai", "new-one", "tool"])
+        # edumind-ai was fetched before the scan was known, then dropped as already present.
+        self.assertIn("/repos/viken/edumind-ai", stub.paths())
+        self.assertEqual(by_name["edumind_ai"].description, "edumind_ai is a python service with a REST api.")
+
+
+class LocalRemoteOwnershipTests(unittest.TestCase):
+    def test_own_origin_without_upstream_is_still_checked(self):
+        # A GitHub fork cloned the usual way: origin under the user, no upstream.
+        fork = {"name": "awesome-llm-apps", "fork": True}
+        for prefetch in (True, False):
+            routes = {"/repos/viken/awesome-llm-apps": fork, OWNED_PATH: [fork]}
+            with tempfile.TemporaryDirectory() as d, StubGitHub(routes) as stub:
+                base = pathlib.Path(d)
+                (base / "awesome-llm-apps" / ".git").mkdir(parents=True)
+                (base / "awesome-llm-apps" / "README.md").write_text("LLM apps in python.", encoding="utf-8")
+                (base / "awesome-llm-apps" / ".git" / "config").write_text(
+                    '[remote "origin"]\n\turl = git@github.com:viken/awesome-llm-apps.git\n', encoding="utf-8"
+                )
+                (base / "site").mkdir()
+                cfg = _make_cfg(scan_paths=[".."], github_fallback_limit=0, prefetch_owned_repos=prefetch)
+                stats = pb.BuildStats()
+                projects = pb.collect_projects(base / "site", cfg, pb.GitHubClient(api_base=stub.api_base, stats=stats))
+            self.assertEqual(projects, [], prefetch)
+            self.assertEqual(stats.counters["dropped_fork"], 1, prefetch)
+
+
+class RankedOwnershipTests(unittest.TestCase):
+    # Fewer keywords, fewer skills, lower local score: proj-a ranks first.
+    README_KEYWORDS = {
+        "proj-a": "python docker aws java react llm",
+        "proj-b": "python docker aws java react",
+        "proj-c": "python docker aws java",
+        "proj-d": "python docker aws",
+        "proj-e": "java",
+        "proj-f": "java",
+        "proj-g": "java",
+        "proj-h": "java",
+        "proj-a-backup-2": "java",
+    }
+
+    def _collect(self, max_projects):
+        routes = {f"/repos/viken/{name}": {"name": name, "fork": name == "proj-b"} for name in self.README_KEYWORDS}
+        with tempfile.TemporaryDirectory() as d, StubGitHub(routes) as stub:
+            base = pathlib.Path(d)
+            for name, keywords in self.README_KEYWORDS.items():
+                (base / name).mkdir()
+                (base / name / "README.md").write_text(f"A tool built with {keywords}.", encoding="utf-8")
+            (base / "site").mkdir()
+            cfg = _make_cfg(scan_paths=[".."], max_projects=max_projects, network_workers=1, prefetch_owned_repos=False)
+            stats = pb.BuildStats()
+            projects = pb.collect_projects(base / "site", cfg, pb.GitHubClient(api_base=stub.api_base, stats=stats))
+        return [p.name for p in projects], {path.rsplit("/", 1)[-1] for path in stub.paths()}, stats
+
+    def test_candidates_that_cannot_place_are_not_checked(self):
+        names, checked, stats = self._collect(max_projects=2)
+        self.assertEqual(names, ["proj-a", "proj-c"])
+        # The backup copy shares proj-a's dedup key, so it is checked as soon as
+        # proj-a is kept even though it scores lowest; with it, four projects
+        # are kept (the fallback floor) and the rest are pruned.
+        self.assertEqual(checked, {"proj-a", "proj-b", "proj-c", "proj-d", "proj-a-backup-2"})
+        self.assertEqual(stats.counters["ownership_pruned"], 4)
+        self.assertEqual(stats.counters["dropped_fork"], 1)
+
+    def test_pruned_ranking_matches_checking_everything(self):
+        everything, checked, stats = self._collect(max_projects=len(self.README_KEYWORDS))
+        self.assertEqual(checked, set(self.README_KEYWORDS))
+        self.assertEqual(stats.counters["ownership_pruned"], 0)
+        for max_projects in (1, 2, 3, 5):
+            self.assertEqual(self._collect(max_projects)[0], everything[:max_projects])
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_fresh_entry_skips_network_across_runs(self):
+        with tempfile.TemporaryDirectory() as d, StubGitHub(REPOS) as stub:
+            path = pathlib.Path(d) / "cache.json"
+            url = f"{stub.api_base}/repos/viken/original"
+            first = pb.GitHubClient(api_base=stub.api_base, cache=pb.ResponseCache(path, ttl=3600))
+            self.assertFalse(first.get_json(url, timeout=5).from_cache)
+            first.close()
+
+            second = pb.GitHubClient(api_base=stub.api_base, cache=pb.ResponseCache(path, ttl=3600))
+            response = second.get_json(url, timeout=5)
+            self.assertTrue(response.from_cache)
+            self.assertEqual(response.payload["name"], "original")
+        self.assertEqual(len(stub.requests), 1)
+
+    def test_stale_entry_is_revalidated_with_etag(self):
+        with tempfile.TemporaryDirectory() as d, StubGitHub(REPOS) as stub:
+            path = pathlib.Path(d) / "cache.json"
+            url = f"{stub.api_base}/repos/viken/forked"
+            first = pb.GitHubClient(api_base=stub.api_base, cache=pb.ResponseCache(path, ttl=3600))
+            first.get_json(url, timeout=5)
+            first.close()
+
+            refreshed = pb.GitHubClient(api_base=stub.api_base, cache=pb.ResponseCache(path, ttl=3600, refresh=True))
+            response = refreshed.get_json(url, timeout=5)
+        self.assertTrue(response.from_cache)
+        self.assertTrue(response.payload["fork"])
+        self.assertEqual(len(stub.requests), 2)
+        self.assertIn("If-None-Match", stub.requests[1][1])
+
+    def test_missing_or_corrupt_cache_file_starts_empty(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / "cache.json"
+            path.write_text("{not json", encoding="utf-8")
+            self.assertIsNone(pb.ResponseCache(path, ttl=60).lookup("https://x"))
+
+
+class OfflineTests(unittest.TestCase):
+    def test_stale_cache_is_served_and_misses_go_unanswered(self):
+        with tempfile.TemporaryDirectory() as d, StubGitHub(REPOS) as stub:
+            path = pathlib.Path(d) / "cache.json"
+            online = pb.GitHubClient(api_base=stub.api_base, cache=pb.ResponseCache(path, ttl=3600))
+            online.get_json(f"{stub.api_base}/repos/viken/forked", timeout=5)
+            online.close()
+
+            offline = pb.GitHubClient(
+                api_base=stub.api_base, cache=pb.ResponseCache(path, ttl=0), token="t", offline=True
+            )
+            cache = {}
+            self.assertFalse(pb.is_original_repo("https://github.com/viken/forked", "viken", cache, offline))
+            self.assertTrue(pb.is_original_repo("https://github.com/viken/original", "viken", cache, offline))
+            self.assertFalse(offline.graphql)
+            self.assertIsNone(offline.post_json(f"{stub.api_base}/graphql", {"query": "{}"}, timeout=5))
+        self.assertEqual(len(stub.requests), 1)
+        self.assertEqual(cache, {"viken/forked": False})
+        self.assertEqual(offline.stats.counters["offline_misses"], 2)
+        self.assertEqual(offline.stats.counters["ownership_unresolved"], 1)
+
+
+class KeepAliveServer(StubServer):
+    """HTTP/1.1 server for AsyncHttpPool: counts connections, can chunk, redirect or stall."""
+
+    keep_alive = True
+
+    def do_GET(self, handler):
+        if handler.path == "/moved":
+            handler.send_response(301)
+            handler.send_header("Location", "/repos/viken/original")
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+        if handler.path == "/slow":
+            time.sleep(1)
+        payload = {"path": handler.path, "fill": "x" * 5000}
+        if not handler.path.startswith("/chunked"):
+            send_json(handler, 200, payload)
+            return
+        body = json.dumps(payload).encode("utf-8")
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+        for start in range(0, len(body), 1000):
+            piece = body[start : start + 1000]
+            handler.wfile.write(f"{len(piece):x}\r\n".encode("ascii") + piece + b"\r\n")
+        handler.wfile.write(b"0\r\n\r\n")
+
+
+class AsyncHttpPoolTests(unittest.TestCase):
+    def test_connections_are_reused_across_threads(self):
+        with KeepAliveServer() as server:
+            client = pb.GitHubClient(api_base=server.api_base, max_connections=3)
+            links = [f"https://github.com/viken/repo-{i}" for i in range(30)]
+            verdicts = pb.resolve_ownership(links, "viken", {}, workers=6, client=client)
+            client.close()
+        self.assertEqual(len(verdicts), 30)
+        self.assertLessEqual(server.connections, 3)
+
+    def test_chunked_body_and_redirect(self):
+        with KeepAliveServer() as server:
+            client = pb.GitHubClient(api_base=server.api_base)
+            chunked = client.get_json(f"{server.api_base}/chunked", timeout=5)
+            moved = client.get_json(f"{server.api_base}/moved", timeout=5)
+            client.close()
+        self.assertEqual(len(chunked.payload["fill"]), 5000)
+        self.assertEqual(moved.payload["path"], "/repos/viken/original")
+
+    def test_request_timeout_is_per_request(self):
+        stats = pb.BuildStats()
+        with KeepAliveServer() as server:
+            client = pb.GitHubClient(api_base=server.api_base, stats=stats)
+            started = time.perf_counter()
+            self.assertIsNone(client.get_json(f"{server.api_base}/slow", timeout=0.2))
+            elapsed = time.perf_counter() - started
+            self.assertIsNotNone(client.get_json(f"{server.api_base}/fast", timeout=5))
+            client.close()
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(stats.counters["http_errors"], 1)
+
+
+class DeadlineTests(unittest.TestCase):
+    def test_stalled_requests_end_at_the_deadline(self):
+        stats = pb.BuildStats()
+        with KeepAliveServer() as server:
+            client = pb.GitHubClient(api_base=server.api_base, stats=stats, max_connections=1)
+            client.deadline = time.monotonic() + 0.3
+            started = time.perf_counter()
+            # Two stalled requests share one connection: the queued one must not get its own 10s.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                answers = list(pool.map(lambda _: client.get_json(f"{server.api_base}/slow", timeout=10), range(2)))
+            self.assertIsNone(client.get_json(f"{server.api_base}/fast", timeout=10))
+            elapsed = time.perf_counter() - started
+            client.close()
+        self.assertEqual(answers, [None, None])
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(stats.counters["deadline_skipped"], 3)
+        self.assertNotIn("http_errors", stats.counters)
+
+    def test_expired_build_still_collects_from_cache_and_defaults(self):
+        with tempfile.TemporaryDirectory() as d, StubGitHub(PipelinedCollectTests.ROUTES) as stub:
+            base = pathlib.Path(d)
+            for name in ("tool", "forked", "local-only"):
+                (base / name).mkdir()
+                (base / name / "README.md").write_text(f"{name} is a python service with a REST api.", encoding="utf-8")
+            (base / "site").mkdir()
+            cache = pb.ResponseCache(base / "cache.json", ttl=0)
+            warm = pb.GitHubClient(api_base=stub.api_base, cache=cache)
+            warm.get_json(f"{stub.api_base}/repos/viken/forked", timeout=5)
+            warm.close()
+            requests_before = len(stub.requests)
+
+            stats = pb.BuildStats()
+            client = pb.GitHubClient(api_base=stub.api_base, cache=pb.ResponseCache(base / "cache.json", ttl=0), stats=stats)
+            client.deadline = time.monotonic()
+            cfg = _make_cfg(scan_paths=[".."], preferred_projects=["new-one"])
+            projects = pb.collect_projects(base / "site", cfg, client, stats=stats)
+            output = pb.write_output(base / "site", projects)
+            self.assertTrue(output.read_text(encoding="utf-8").startswith("export const generatedAt = "))
+        self.assertEqual(len(stub.requests), requests_before)
+        # The stale cached fork verdict is still used; unanswered repos are kept.
+        self.assertEqual(sorted(p.name for p in projects), ["local-only", "tool"])
+        self.assertLessEqual({"ownership", "preferred"}, set(stats.degraded))
+        self.assertIn("degraded by --deadline", stats.report())
+
+    def test_rate_limit_wait_past_the_deadline_is_a_deadline_skip(self):
+        stats = pb.BuildStats()
+        scheduler = pb.RateLimitScheduler(max_wait=60)
+        scheduler.observe(403, {"retry-after": "30"}, attempt=0)
+        client = pb.GitHubClient(api_base="http://127.0.0.1:9", stats=stats, scheduler=scheduler)
+        client.deadline = time.monotonic() + 5
+        with stats.stage("ownership", network=True):
+            self.assertIsNone(client.get_json("http://127.0.0.1:9/repos/viken/tool", timeout=5))
+        self.assertEqual(stats.counters["deadline_skipped"], 1)
+        self.assertNotIn("http_errors", stats.counters)
+        self.assertEqual(stats.degraded, ["ownership"])
+
+    def test_skips_are_charged_to_the_stage_that_made_them(self):
+        stats = pb.BuildStats()
+        client = pb.GitHubClient(api_base="http://127.0.0.1:9", stats=stats)
+        client.deadline = time.monotonic()
+        links = [f"https://github.com/viken/repo-{i}" for i in range(6)]
+        overlap = threading.Barrier(2)
+
+        def run(name, lookups):
+            with stats.stage(name, network=True):
+                overlap.wait()
+                pb.resolve_ownership(lookups, "viken", {}, workers=4, client=client)
+                overlap.wait()
+
+        # "ownership" skips lookups on pool threads while "preferred" runs alongside without any.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(run, ["ownership", "preferred"], [links, []]))
+        self.assertEqual(stats.counters["deadline_skipped"], 6)
+        self.assertEqual(stats.degraded, ["ownership"])
+
+
+class ScriptedServer(StubServer):
+    """Answers GETs with `script` entries (status, headers, payload) in order, then 200s."""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = list(script)
+        self.requests = 0
+
+    def do_GET(self, handler):
+        self.requests += 1
+        status, headers, payload = self.script.pop(0) if self.script else (200, {}, {"fork": True})
+        send_json(handler, status, payload, headers)
+
+
+def _quota(remaining, reset_in):
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(time.time() + reset_in))}
+
+
+class RateLimitTests(unittest.TestCase):
+    LINK = "https://github.com/viken/tool"
+
+    def test_rate_limited_lookup_is_not_cached(self):
+        with ScriptedServer([(403, _quota(0, 3600), {"message": "API rate limit exceeded"})]) as server:
+            client = pb.GitHubClient(api_base=server.api_base, scheduler=pb.RateLimitScheduler(max_wait=1))
+            cache = {}
+            self.assertTrue(pb.is_original_repo(self.LINK, "viken", cache, client))
+            self.assertEqual(cache, {})
+            # The quota is spent until a reset an hour away: refused without a request.
+            self.assertTrue(pb.is_original_repo(self.LINK, "viken", cache, client))
+            client.close()
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(cache, {})
+
+    def test_retry_after_is_honoured_then_answer_cached(self):
+        with ScriptedServer([(502, {}, {}), (429, {"Retry-After": "0"}, {})]) as server:
+            stats = pb.BuildStats()
+            client = pb.GitHubClient(api_base=server.api_base, stats=stats)
+            cache = {}
+            self.assertFalse(pb.is_original_repo(self.LINK, "viken", cache, client))
+            client.close()
+        self.assertEqual(cache, {"viken/tool": False})
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(stats.counters["http_retries"], 2)
+
+    def test_not_found_is_an_answer(self):
+        with ScriptedServer([(404, {}, {"message": "Not Found"})]) as server:
+            client = pb.GitHubClient(api_base=server.api_base)
+            cache = {}
+            self.assertTrue(pb.is_original_repo(self.LINK, "viken", cache, client))
+            client.close()
+        self.assertEqual(cache, {"viken/tool": True})
+
+    def test_low_quota_spreads_requests_until_reset(self):
+        scheduler = pb.RateLimitScheduler(reserve=10)
+        scheduler.observe(200, {k.lower(): v for k, v in _quota(4, 2).items()}, attempt=0)
+        started = time.perf_counter()
+        scheduler.wait_turn()
+        self.assertGreater(time.perf_counter() - started, 0.05)
+        self.assertEqual(scheduler.remaining, 3)
+
+    def test_wait_beyond_max_wait_raises(self):
+        scheduler = pb.RateLimitScheduler(max_wait=5)
+        scheduler.observe(403, {"retry-after": "120"}, attempt=0)
+        with self.assertRaises(pb.RateLimitExceeded):
+            scheduler.wait_turn()
+
+    def test_low_quota_with_a_distant_reset_paces_at_max_wait(self):
+        scheduler = pb.RateLimitScheduler(max_wait=0.05, reserve=10)
+        scheduler.observe(200, {k.lower(): v for k, v in _quota(9, 1800).items()}, attempt=0)
+        for remaining in (8, 7, 6):
+            self.assertAlmostEqual(scheduler.wait_turn(), 0.05)
+            self.assertEqual(scheduler.remaining, remaining)
+
+    def test_refused_turn_does_not_spend_quota(self):
+        scheduler = pb.RateLimitScheduler(max_wait=5)
+        scheduler.observe(200, {k.lower(): v for k, v in _quota(0, 1800).items()}, attempt=0)
+        for _ in range(3):
+            with self.assertRaisesRegex(pb.RateLimitExceeded, "resets in"):
+                scheduler.wait_turn()
+        self.assertEqual(scheduler.remaining, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,9 +14,18 @@ Run with either:
     pytest tests/
 """
 
+import contextlib
+import io
+import json
+import os
 import pathlib
+import random
+import re
+import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "scripts"))
@@ -64,6 +73,35 @@ class FindReadmeTests(unittest.TestCase):
             self.assertIsNone(pb.find_readme(root))
 
 
+def _legacy_names(name):
+    """normalize_name / canonical_name_key / is_backup_like_name before memoization."""
+    normalized = re.sub(r"[^a-z0-9]+", "-", name.strip().lower())
+    normalized = re.sub(r"-+", "-", normalized).strip("-")
+    key = re.sub(r"(?:-|_)?backup(?:-|_)?\d.*$", "", normalized)
+    key = re.sub(r"(?:-|_)?\d{8,}$", "", key)
+    key = re.sub(r"(?:-|_)?(copy|old)$", "", key)
+    key = re.sub(r"-+", "-", key).strip("-")
+    return normalized, key, bool(re.search(r"(?:^|-)(backup|copy|old)(?:-|$)", normalized))
+
+
+class NameHelperTests(unittest.TestCase):
+    def test_matches_legacy_regexes(self):
+        rng = random.Random(14)
+        parts = ["edu", "Mind", "AI", "backup", "copy", "old", "2024", "20240131", "1", "_", "-", " ", ".", "--", "é"]
+        names = ["".join(rng.choice(parts) for _ in range(rng.randint(0, 7))) for _ in range(3000)]
+        names += ["backup", "my-app-backup-2", "tool_copy", "svc-old", "x-12345678", "-old-", "old"]
+        for name in names:
+            self.assertEqual(
+                (pb.normalize_name(name), pb.canonical_name_key(name), pb.is_backup_like_name(name)),
+                _legacy_names(name),
+                name,
+            )
+
+    def test_caches_are_bounded(self):
+        for helper in (pb.normalize_name, pb.canonical_name_key, pb.is_backup_like_name):
+            self.assertEqual(helper.cache_info().maxsize, pb.NAME_CACHE_SIZE)
+
+
 class CanonicalGithubLinkTests(unittest.TestCase):
     def test_canonical_github_link_empty(self):
         self.assertEqual(pb.canonical_github_link(""), "")
@@ -158,6 +196,103 @@ class InferSkillsEdgeTests(unittest.TestCase):
         self.assertEqual(pb.infer_skills("   ", "   "), ["Backend", "AI"])
 
 
+def _reference_skills(rules, project_name, readme_text):
+    """The per-keyword matcher infer_skills used before SkillMatcher, kept as an oracle."""
+    corpus = re.sub(r"\s+", " ", f"{project_name} {readme_text}".lower())
+
+    def has_keyword(keyword):
+        token = keyword.lower().strip()
+        if not token:
+            return False
+        if any(separator in token for separator in (" ", ".", "/", "+", "-")):
+            return token in corpus
+        return re.search(rf"(?<![a-z0-9]){re.escape(token)}(?![a-z0-9])", corpus) is not None
+
+    return [skill for skill, keywords in rules if any(has_keyword(keyword) for keyword in keywords)]
+
+
+class SkillMatcherTests(unittest.TestCase):
+    # Keywords that overlap at the same offset or inside each other.
+    OVERLAP_RULES = [
+        ("Phrase", ["machine learning", "web app"]),
+        ("Word", ["machine", "web", "end"]),
+        ("Nested", ["end-to-end", "to-end", "backend"]),
+        ("Java", ["java", "javascript"]),
+    ]
+
+    def _fuzz_texts(self, rules, count=400):
+        rng = random.Random(1234)
+        pieces = [k for _, keywords in rules for k in keywords] + ["x", "ai", "9", "-", ".", "/"]
+        glue = [" ", "", "\n", "\t ", "-", "x", "  "]
+        for _ in range(count):
+            yield "".join(rng.choice(pieces) + rng.choice(glue) for _ in range(rng.randint(0, 8)))
+
+    def test_matches_reference_on_skill_rules(self):
+        for text in self._fuzz_texts(pb.SKILL_RULES):
+            expected = _reference_skills(pb.SKILL_RULES, "proj", text) or ["Backend", "AI"]
+            self.assertEqual(pb.infer_skills("proj", text), expected[:6], text)
+
+    def test_matches_reference_on_overlapping_keywords(self):
+        matcher = pb.SkillMatcher(self.OVERLAP_RULES)
+        for text in self._fuzz_texts(self.OVERLAP_RULES):
+            self.assertEqual(matcher.skills(text.lower()), _reference_skills(self.OVERLAP_RULES, "", text), text)
+
+    def test_phrase_inside_word_and_across_lines(self):
+        matcher = pb.SkillMatcher(self.OVERLAP_RULES)
+        self.assertEqual(matcher.find("backend-to-end"), {"backend", "end-to-end", "to-end", "end"})
+        self.assertEqual(matcher.find("machine\n  learning"), {"machine learning", "machine"})
+        # Substring phrase still matches, but the prefix word needs a boundary.
+        self.assertEqual(matcher.find("xmachine learning"), {"machine learning"})
+
+
+def _fuzz_readmes(count=300):
+    """Random READMEs mixing fences (inline, multi-line, unclosed), odd line breaks and keywords."""
+    rng = random.Random(99)
+    pieces = [
+        "```", "```py\n", "``", "`", "\n", "\r\n", "\r", "\x0c", " ", "  ", "# Heading\n", "![img](x.png)\n",
+        "Installation\n", "This project builds a react frontend and a FastAPI backend for people.",
+        "A machine\nlearning pipeline that runs in docker on aws lambda with python code. ",
+        "short line", "Visit https://example.com for more information about this repository today. ",
+        "**Bold** and [a link](http://x) in a sentence that is long enough to be kept. ",
+    ]
+    for _ in range(count):
+        yield "".join(rng.choice(pieces) for _ in range(rng.randint(0, 25)))
+
+
+class StreamingReadmeTests(unittest.TestCase):
+    def test_unfenced_lines_match_regex_removal(self):
+        for text in _fuzz_readmes():
+            expected = re.sub(r"```[\s\S]*?```", "", text).splitlines()
+            got = list(pb.iter_unfenced_lines(io.StringIO(text, newline="")))
+            self.assertEqual(got, expected, repr(text))
+
+    def test_analyze_readme_matches_whole_text_functions(self):
+        old_block = pb.SKILL_SCAN_BLOCK
+        pb.SKILL_SCAN_BLOCK = 7  # force many block seams
+        try:
+            with tempfile.TemporaryDirectory() as d:
+                readme = pathlib.Path(d) / "README.md"
+                for text in _fuzz_readmes(150):
+                    readme.write_text(text, encoding="utf-8", newline="")
+                    content = readme.read_text(encoding="utf-8", errors="ignore")
+                    self.assertEqual(
+                        pb.analyze_readme(readme, "proj"),
+                        (pb.summarize_readme(content), pb.infer_skills("proj", content)),
+                        repr(text),
+                    )
+        finally:
+            pb.SKILL_SCAN_BLOCK = old_block
+
+    def test_summary_stops_reading_early(self):
+        lines = ["This opening paragraph line is easily long enough to keep.\n"] * 5
+
+        def endless():
+            yield from lines
+            raise AssertionError("summarizer read past the lines it needed")
+
+        self.assertTrue(pb.summarize_lines(pb.iter_unfenced_lines(endless())).startswith("This opening"))
+
+
 class IsOriginalRepoNonNetworkTests(unittest.TestCase):
     def test_non_github_link_is_original(self):
         # parse_github_repo returns None -> True, no network.
@@ -193,55 +328,536 @@ class IsOriginalRepoNonNetworkTests(unittest.TestCase):
         )
 
 
+class ResolveOwnershipTests(unittest.TestCase):
+    LINKS = [
+        "https://github.com/viken/a",
+        "https://github.com/viken/fork",
+        "https://gitlab.com/u/r",
+        "https://github.com/someoneelse/repo",
+        "https://github.com/viken/a",
+        "",
+    ]
+
+    def _cache(self):
+        # Pre-seeded so every github.com/viken lookup is a cache hit (no network).
+        return {"viken/a": True, "viken/fork": False}
+
+    def test_parallel_matches_serial(self):
+        serial = pb.resolve_ownership(self.LINKS, "viken", self._cache(), workers=1)
+        parallel = pb.resolve_ownership(self.LINKS, "viken", self._cache(), workers=4)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(
+            serial,
+            {
+                "https://github.com/viken/a": True,
+                "https://github.com/viken/fork": False,
+                "https://gitlab.com/u/r": True,
+                "https://github.com/someoneelse/repo": False,
+            },
+        )
+
+    def test_cache_is_not_overwritten(self):
+        cache = self._cache()
+        pb.resolve_ownership(self.LINKS, "viken", cache, workers=4)
+        self.assertEqual(cache, {"viken/a": True, "viken/fork": False})
+
+
+def _write_checkouts(base):
+    """Three checkouts with READMEs, one without, and a hidden one, under `base`."""
+    readmes = {
+        "Beta": "Beta is a FastAPI backend service that exposes a REST api for data.",
+        "alpha": "Alpha is a react frontend application written in typescript for users.",
+        "gamma": "Gamma trains a pytorch model for object detection on aerial images.",
+    }
+    for name, text in readmes.items():
+        (base / name).mkdir()
+        (base / name / "README.md").write_text(text, encoding="utf-8")
+    (base / "no-readme").mkdir()
+    (base / ".hidden").mkdir()
+    (base / ".hidden" / "README.md").write_text("hidden", encoding="utf-8")
+
+
+def _write_git_config(project_dir, remotes):
+    (project_dir / ".git").mkdir()
+    sections = "".join(
+        f'[remote "{name}"]\n\turl = {url}\n\tfetch = +refs/heads/*:refs/remotes/{name}/*\n'
+        for name, url in remotes.items()
+    )
+    (project_dir / ".git" / "config").write_text(f"[core]\n\tbare = false\n{sections}", encoding="utf-8")
+
+
+class LocalGitMetadataTests(unittest.TestCase):
+    def test_github_remote_link_forms(self):
+        for url in (
+            "git@github.com:Viken/Repo.git",
+            "https://github.com/Viken/Repo",
+            "https://token@github.com/Viken/Repo.git/",
+            "ssh://git@ssh.github.com:443/Viken/Repo.git",
+            "github.com:Viken/Repo",
+        ):
+            self.assertEqual(pb.github_remote_link(url), "https://github.com/Viken/Repo", url)
+        for url in ("git@gitlab.com:v/r.git", "/srv/git/repo.git", "https://github.com/only-owner", ""):
+            self.assertEqual(pb.github_remote_link(url), "", url)
+
+    def test_remotes_and_worktree_pointer(self):
+        with tempfile.TemporaryDirectory() as d:
+            main = pathlib.Path(d) / "main"
+            main.mkdir()
+            _write_git_config(main, {"origin": "git@github.com:viken/main.git", "upstream": "https://github.com/up/main"})
+            worktree_git = main / ".git" / "worktrees" / "wt"
+            worktree_git.mkdir(parents=True)
+            (worktree_git / "commondir").write_text("../..\n", encoding="utf-8")
+            worktree = pathlib.Path(d) / "wt"
+            worktree.mkdir()
+            (worktree / ".git").write_text(f"gitdir: {worktree_git}\n", encoding="utf-8")
+
+            expected = {"origin": "git@github.com:viken/main.git", "upstream": "https://github.com/up/main"}
+            self.assertEqual(pb.read_git_remotes(main), expected)
+            self.assertEqual(pb.read_git_remotes(worktree), expected)
+            self.assertEqual(pb.read_git_remotes(pathlib.Path(d)), {})
+
+    def test_ownership_verdicts(self):
+        cases = {
+            "own": ({"origin": "git@github.com:viken/own.git"}, None),
+            "fork": ({"origin": "git@github.com:viken/fork.git", "upstream": "https://github.com/up/fork.git"}, False),
+            "same-upstream": ({"origin": "https://github.com/viken/s", "upstream": "git@github.com:viken/s.git"}, None),
+            "other-owner": ({"origin": "https://github.com/someone/else"}, False),
+            "gitlab": ({"origin": "git@gitlab.com:viken/g.git"}, None),
+        }
+        with tempfile.TemporaryDirectory() as d:
+            for name, (remotes, expected) in cases.items():
+                project_dir = pathlib.Path(d) / name
+                project_dir.mkdir()
+                _write_git_config(project_dir, remotes)
+                self.assertEqual(pb.local_repo_ownership(project_dir, "Viken")[1], expected, name)
+            self.assertEqual(pb.local_repo_ownership(pathlib.Path(d) / "own", ""), ("https://github.com/viken/own", None))
+
+
+class CollectProjectsLocalTests(unittest.TestCase):
+    """collect_projects over a temp tree; no username -> no links -> no network."""
+
+    def test_offline_build_imports_no_network_modules(self):
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import pathlib, portfolio_builder as pb\n"
+            "cfg = pb.BuilderConfig(scan_paths=['..'], skip_projects=set(), exclude_projects=set(),"
+            " github_username='viken', project_github={}, max_projects=24, preferred_projects=['x'],"
+            " github_fallback_limit=30)\n"
+            "client = pb.GitHubClient(api_base='http://127.0.0.1:9', offline=True)\n"
+            "pb.collect_projects(pathlib.Path(sys.argv[2]), cfg, client)\n"
+            "print(sorted({'asyncio', 'ssl', 'urllib.request', 'concurrent.futures'} & set(sys.modules)))\n"
+        )
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            (base / "site").mkdir()
+            scripts = pathlib.Path(pb.__file__).parent
+            result = subprocess.run(
+                [sys.executable, "-c", script, str(scripts), str(base / "site")],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_collects_local_readmes(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            root = base / "site"
+            root.mkdir()
+            projects = pb.collect_projects(root, _make_cfg(scan_paths=[".."]))
+        self.assertEqual(sorted(p.name for p in projects), ["Beta", "alpha", "gamma"])
+        by_name = {p.name: p for p in projects}
+        self.assertIn("Frontend", by_name["alpha"].skills)
+        self.assertEqual(by_name["gamma"].link, "")
+
+    def test_worker_count_does_not_change_output(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            root = base / "site"
+            root.mkdir()
+            serial = pb.collect_projects(root, _make_cfg(scan_paths=[".."], network_workers=1))
+            parallel = pb.collect_projects(root, _make_cfg(scan_paths=[".."], network_workers=6))
+        self.assertEqual(serial, parallel)
+
+    def test_stats_record_stages_and_filter_drops(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            root = base / "site"
+            root.mkdir()
+            stats = pb.BuildStats()
+            cfg = _make_cfg(scan_paths=[".."], skip_projects={"beta"}, exclude_projects={"gamma"}, max_projects=1)
+            projects = pb.collect_projects(root, cfg, stats=stats)
+            readme_bytes = (base / "alpha" / "README.md").stat().st_size
+        self.assertEqual([p.name for p in projects], ["alpha"])
+        self.assertEqual(stats.counters["dropped_skip"], 1)
+        self.assertEqual(stats.counters["dropped_exclude"], 1)
+        self.assertEqual(stats.counters["dropped_no_readme"], 1)
+        self.assertEqual(stats.counters["readme_bytes_read"], readme_bytes)
+        # Network stages run alongside "readmes", so only "scan" has a fixed place.
+        self.assertEqual(next(iter(stats.stages)), "scan")
+        self.assertLessEqual({"readmes", "ownership", "preferred"}, set(stats.stages))
+        self.assertEqual(json.loads(json.dumps(stats.as_dict()))["counters"], stats.counters)
+
+    def test_known_forks_are_dropped_without_a_lookup(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            root = base / "site"
+            root.mkdir()
+            cfg = _make_cfg(
+                scan_paths=[".."],
+                github_username="viken",
+                project_github={"Beta": "https://github.com/viken/beta"},
+                known_forks={"viken/beta"},
+            )
+            stats = pb.BuildStats()
+            client = pb.GitHubClient(api_base="http://127.0.0.1:9", stats=stats, offline=True)
+            projects = pb.collect_projects(root, cfg, client)
+        self.assertEqual(sorted(p.name for p in projects), ["alpha", "gamma"])
+        self.assertEqual(stats.counters["dropped_fork"], 1)
+        self.assertEqual(stats.counters["ownership_cache_hits"], 1)
+        # alpha and gamma link to github.com/viken/* too; offline they stay unchecked.
+        self.assertEqual(stats.counters["ownership_unresolved"], 2)
+        self.assertNotIn("http_requests", stats.counters)
+
+    def test_git_remotes_give_links_and_fork_verdicts(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            _write_git_config(base / "alpha", {"origin": "git@github.com:viken/alpha-app.git"})
+            _write_git_config(
+                base / "Beta", {"origin": "git@github.com:viken/beta.git", "upstream": "https://github.com/up/beta"}
+            )
+            root = base / "site"
+            root.mkdir()
+            stats = pb.BuildStats()
+            client = pb.GitHubClient(api_base="http://127.0.0.1:9", stats=stats, offline=True)
+            projects = pb.collect_projects(root, _make_cfg(scan_paths=[".."], github_username="viken"), client)
+        by_name = {p.name: p for p in projects}
+        self.assertEqual(sorted(by_name), ["alpha", "gamma"])
+        self.assertEqual(by_name["alpha"].link, "https://github.com/viken/alpha-app")
+        self.assertEqual(stats.counters["ownership_local"], 1)
+        self.assertEqual(stats.counters["dropped_fork"], 1)
+        # An origin under the user proves nothing (forks look the same), so
+        # alpha still needs GitHub, as does gamma, which has no .git.
+        self.assertEqual(stats.counters["ownership_lookups"], 2)
+
+    def test_scan_readmes_skips_hidden_and_readmeless_dirs(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            found = pb.scan_readmes(base, _make_cfg(scan_paths=["."], skip_projects={"gamma"}))
+        self.assertEqual([name for name, _ in found], ["alpha", "Beta"])
+        self.assertTrue(all(readme.name == "README.md" for _, readme in found))
+
+    def test_process_pool_matches_serial(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            root = base / "site"
+            root.mkdir()
+            serial = pb.collect_projects(root, _make_cfg(scan_paths=[".."], jobs=1))
+            pooled = pb.collect_projects(root, _make_cfg(scan_paths=[".."], jobs=3))
+        self.assertEqual(serial, pooled)
+
+    def test_manifest_hits_are_not_reanalyzed(self):
+        with tempfile.TemporaryDirectory() as d:
+            base = pathlib.Path(d)
+            _write_checkouts(base)
+            found = pb.scan_readmes(base, _make_cfg(scan_paths=["."]))
+            manifest_path = base / "projects.manifest.json"
+            first = pb.ReadmeManifest(manifest_path)
+            expected = pb.analyze_readmes(found, jobs=2, manifest=first)
+            first.save()
+
+            calls = []
+            original = pb.analyze_readme
+            pb.analyze_readme = lambda readme, name: calls.append(name) or original(readme, name)
+            try:
+                again = pb.analyze_readmes(found, jobs=2, manifest=pb.ReadmeManifest(manifest_path))
+            finally:
+                pb.analyze_readme = original
+        self.assertEqual(again, expected)
+        self.assertEqual(calls, [])
+
+
+class WatchTests(unittest.TestCase):
+    """watch_projects over a temp tree; rebuilds are collected, not written."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        base = pathlib.Path(self._tmp.name)
+        _write_checkouts(base)
+        self.base = base
+        self.root = base / "site"
+        self.root.mkdir()
+        self.config = self.root / "portfolio_builder.json"
+        self.config.write_text(json.dumps({"scan_paths": [".."]}), encoding="utf-8")
+        self.cfg = pb.load_config(self.root, self.config)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _watch(self, use_inotify, edit, expected=2, fail_first=False):
+        manifest = pb.ReadmeManifest(self.base / "manifest.json")
+        passes = []
+
+        def rebuild(cfg):
+            nonlocal fail_first
+            if fail_first and len(passes) == 1:
+                fail_first = False
+                raise FileNotFoundError("README vanished mid-build")
+            stats = pb.BuildStats()
+            passes.append((pb.collect_projects(self.root, cfg, manifest=manifest, stats=stats), stats.counters))
+            manifest.rollover()
+
+        rebuild(self.cfg)
+        stop = threading.Event()
+        watcher = threading.Thread(
+            target=pb.watch_projects,
+            args=(self.root, self.config, self.cfg, rebuild, stop, 0.05, 0.15, use_inotify),
+        )
+        watcher.start()
+        try:
+            time.sleep(0.2)
+            edit()
+            deadline = time.monotonic() + 5
+            while len(passes) < expected and time.monotonic() < deadline:
+                time.sleep(0.02)
+            time.sleep(0.3)
+        finally:
+            stop.set()
+            watcher.join()
+        return passes
+
+    def _burst_edit(self):
+        readme = self.base / "gamma" / "README.md"
+        for text in ("Gamma ", "Gamma is now a docker ", "Gamma is now a docker deployed kubernetes operator for clusters."):
+            readme.write_text(text, encoding="utf-8")
+            time.sleep(0.03)
+
+    def test_polling_rebuilds_once_and_reparses_only_the_edit(self):
+        passes = self._watch(False, self._burst_edit)
+        self.assertEqual(len(passes), 2)
+        projects, counters = passes[1]
+        self.assertEqual((counters["readmes_parsed"], counters["readmes_reused"]), (1, 2))
+        self.assertIn("DevOps", {p.name: p for p in projects}["gamma"].skills)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_inotify_rebuilds_once(self):
+        self.assertEqual(len(self._watch(True, self._burst_edit)), 2)
+
+    def test_config_change_is_reloaded(self):
+        edit = lambda: self.config.write_text(json.dumps({"scan_paths": [".."], "exclude_projects": ["gamma"]}))
+        passes = self._watch(False, edit)
+        self.assertEqual(len(passes), 2)
+        self.assertEqual(sorted(p.name for p in passes[1][0]), ["Beta", "alpha"])
+
+    def test_bad_config_edit_keeps_the_previous_config(self):
+        def edit():
+            self.config.write_text('{"scan_paths": [', encoding="utf-8")
+            time.sleep(0.5)
+            self.config.write_text(json.dumps({"scan_paths": [".."], "max_projects": None}), encoding="utf-8")
+            time.sleep(0.5)
+            self.config.write_text(json.dumps({"scan_paths": [".."], "exclude_projects": ["gamma"]}))
+
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            passes = self._watch(False, edit, expected=4)
+        self.assertEqual(err.getvalue().count("keeping the previous config"), 2)
+        self.assertEqual(len(passes), 4)
+        for projects, _ in passes[1:3]:
+            self.assertEqual(sorted(p.name for p in projects), ["Beta", "alpha", "gamma"])
+        self.assertEqual(sorted(p.name for p in passes[3][0]), ["Beta", "alpha"])
+
+    def test_failed_rebuild_keeps_watching(self):
+        def edit():
+            self._burst_edit()
+            time.sleep(0.5)
+            (self.base / "alpha" / "README.md").write_text("Alpha now ships a docker image.", encoding="utf-8")
+
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            passes = self._watch(False, edit, fail_first=True)
+        self.assertIn("README vanished mid-build", err.getvalue())
+        self.assertEqual(len(passes), 2)
+        self.assertIn("DevOps", {p.name: p for p in passes[1][0]}["alpha"].skills)
+
+
+class ReadmeManifestTests(unittest.TestCase):
+    TEXT = "This service exposes a FastAPI backend with docker based deployment steps."
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self._tmp.name)
+        self.readme = self.dir / "README.md"
+        self.readme.write_text(self.TEXT, encoding="utf-8")
+        self.manifest_path = self.dir / "projects.manifest.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _first_run(self):
+        manifest = pb.ReadmeManifest(self.manifest_path)
+        derived = manifest.analyze(self.readme, "svc")
+        manifest.save()
+        return derived
+
+    def _tamper(self, description):
+        # Rewrite the stored derivation so a reuse is observable in the output.
+        raw = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        raw["readmes"][str(self.readme)]["description"] = description
+        self.manifest_path.write_text(json.dumps(raw), encoding="utf-8")
+
+    def test_first_run_matches_direct_analysis(self):
+        self.assertEqual(self._first_run(), pb.analyze_readme(self.readme, "svc"))
+
+    def test_unchanged_readme_is_served_from_manifest(self):
+        self._first_run()
+        self._tamper("from manifest")
+        description, _ = pb.ReadmeManifest(self.manifest_path).analyze(self.readme, "svc")
+        self.assertEqual(description, "from manifest")
+
+    def test_touched_but_identical_readme_reuses_by_hash(self):
+        self._first_run()
+        self._tamper("from manifest")
+        stat = self.readme.stat()
+        os.utime(self.readme, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        description, _ = pb.ReadmeManifest(self.manifest_path).analyze(self.readme, "svc")
+        self.assertEqual(description, "from manifest")
+
+    def test_changed_readme_is_reparsed(self):
+        self._first_run()
+        self._tamper("from manifest")
+        self.readme.write_text("A react frontend dashboard written in typescript for analysts.", encoding="utf-8")
+        description, skills = pb.ReadmeManifest(self.manifest_path).analyze(self.readme, "svc")
+        self.assertNotEqual(description, "from manifest")
+        self.assertIn("Frontend", skills)
+
+    def test_fingerprint_change_discards_manifest(self):
+        self._first_run()
+        self._tamper("from manifest")
+        raw = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        raw["fingerprint"] = "older-builder"
+        self.manifest_path.write_text(json.dumps(raw), encoding="utf-8")
+        description, _ = pb.ReadmeManifest(self.manifest_path).analyze(self.readme, "svc")
+        self.assertEqual(description, self.TEXT)
+
+    def test_reuse_false_ignores_existing_file(self):
+        self._first_run()
+        self._tamper("from manifest")
+        description, _ = pb.ReadmeManifest(self.manifest_path, reuse=False).analyze(self.readme, "svc")
+        self.assertEqual(description, self.TEXT)
+
+
+class ProjectTests(unittest.TestCase):
+    def test_derived_keys_and_round_trip(self):
+        project = pb.Project(
+            name="EduMind AI-backup-2", description="d" * 30, link=" https://www.github.com/v/EduMind/ ", skills=["AI", "Python"]
+        )
+        self.assertEqual(project.skills, ("AI", "Python"))
+        self.assertEqual(project.normalized_name, "edumind-ai-backup-2")
+        self.assertEqual(project.canonical_name, "edumind-ai")
+        self.assertEqual(project.canonical_link, "github.com/v/edumind")
+        self.assertEqual(pb.project_quality_score(project, {"edumind-ai-backup-2"}), project.base_score + 1000)
+        self.assertEqual(pb.Project(**project.as_dict()), project)
+        self.assertEqual(project.as_dict()["skills"], ["AI", "Python"])
+
+    def test_is_frozen_and_slotted(self):
+        project = pb.Project(name="a", description="", link="", skills=[])
+        self.assertFalse(hasattr(project, "__dict__"))
+        with self.assertRaises(AttributeError):
+            project.name = "b"
+
+
 class DeduplicateTieBreakTests(unittest.TestCase):
     def test_incoming_backup_is_dropped_in_favor_of_current(self):
         projects = [
-            {"name": "Proj", "description": "d", "link": "", "skills": ["A"]},
-            {"name": "Proj-backup-20240101", "description": "much longer desc", "link": "", "skills": ["A", "B"]},
+            pb.Project(name="Proj", description="d", link="", skills=["A"]),
+            pb.Project(name="Proj-backup-20240101", description="much longer desc", link="", skills=["A", "B"]),
         ]
         deduped = pb.deduplicate_projects(projects, 24)
         self.assertEqual(len(deduped), 1)
         # Current (non-backup) wins even though the incoming backup is richer.
-        self.assertEqual(deduped[0]["name"], "Proj")
+        self.assertEqual(deduped[0].name, "Proj")
 
     def test_richer_incoming_replaces_current_on_skills(self):
         projects = [
-            {"name": "Proj", "description": "same", "link": "", "skills": ["A"]},
-            {"name": "Proj-copy", "description": "same", "link": "", "skills": ["A", "B", "C"]},
+            pb.Project(name="Proj", description="same", link="", skills=["A"]),
+            pb.Project(name="Proj-copy", description="same", link="", skills=["A", "B", "C"]),
         ]
         deduped = pb.deduplicate_projects(projects, 24)
         self.assertEqual(len(deduped), 1)
         # Neither is backup-like via the (^|-)backup|copy|old check? "copy" IS.
         # current is non-backup, incoming "-copy" is backup-like -> incoming dropped.
-        self.assertEqual(deduped[0]["name"], "Proj")
+        self.assertEqual(deduped[0].name, "Proj")
 
     def test_richer_incoming_replaces_when_neither_backup(self):
         projects = [
-            {"name": "Proj", "description": "short", "link": "", "skills": ["A"]},
-            {"name": "Proj", "description": "a substantially longer description wins", "link": "", "skills": ["A"]},
+            pb.Project(name="Proj", description="short", link="", skills=["A"]),
+            pb.Project(name="Proj", description="a substantially longer description wins", link="", skills=["A"]),
         ]
         deduped = pb.deduplicate_projects(projects, 24)
         self.assertEqual(len(deduped), 1)
         # Same canonical key, neither backup-like, longer description wins.
-        self.assertEqual(deduped[0]["description"], "a substantially longer description wins")
+        self.assertEqual(deduped[0].description, "a substantially longer description wins")
 
     def test_link_keyed_when_name_empty(self):
         # Empty names -> canonical_name empty -> key falls back to canonical link.
         projects = [
-            {"name": "", "description": "one", "link": "https://github.com/x/y", "skills": []},
-            {"name": "", "description": "two longer entry here", "link": "https://github.com/x/y", "skills": []},
+            pb.Project(name="", description="one", link="https://github.com/x/y", skills=[]),
+            pb.Project(name="", description="two longer entry here", link="https://github.com/x/y", skills=[]),
         ]
         deduped = pb.deduplicate_projects(projects, 24)
         self.assertEqual(len(deduped), 1)
 
     def test_current_backup_replaced_by_non_backup_incoming(self):
         projects = [
-            {"name": "Proj-backup-1", "description": "d", "link": "", "skills": []},
-            {"name": "Proj", "description": "d", "link": "", "skills": []},
+            pb.Project(name="Proj-backup-1", description="d", link="", skills=[]),
+            pb.Project(name="Proj", description="d", link="", skills=[]),
         ]
         deduped = pb.deduplicate_projects(projects, 24)
         self.assertEqual(len(deduped), 1)
-        self.assertEqual(deduped[0]["name"], "Proj")
+        self.assertEqual(deduped[0].name, "Proj")
+
+
+class DeduplicateMultiKeyTests(unittest.TestCase):
+    def test_same_repo_under_two_directory_names_merges(self):
+        projects = [
+            pb.Project(name="edumind", description="short", link="https://github.com/v/EduMind-AI", skills=[]),
+            pb.Project(name="tutor-app", description="longer text", link="https://www.github.com/v/edumind-ai/", skills=[]),
+            pb.Project(name="other", description="x", link="https://github.com/v/other", skills=[]),
+        ]
+        deduped = pb.deduplicate_projects(projects)
+        self.assertEqual([p.name for p in deduped], ["tutor-app", "other"])
+
+    def test_merges_are_transitive(self):
+        # a~b share a name, b~c share a link: all three are one project.
+        projects = [
+            pb.Project(name="Proj", description="a", link="", skills=[]),
+            pb.Project(name="proj-copy", description="bb", link="https://github.com/v/p", skills=[]),
+            pb.Project(name="renamed", description="c", link="https://github.com/v/p", skills=["X"]),
+            pb.Project(name="", description="", link="", skills=[]),
+            pb.Project(name="", description="longest of the keyless", link="", skills=[]),
+        ]
+        deduped = pb.deduplicate_projects(projects)
+        # "renamed" ties "Proj" on backup-ness and description length, then wins on skills.
+        self.assertEqual([p.description for p in deduped], ["c", "longest of the keyless"])
+
+    def test_survivor_does_not_depend_on_input_order(self):
+        rng = random.Random(16)
+        names = ["svc", "svc-backup-2", "svc old", "svc_copy", "api", "api-old", "web"]
+        links = ["", "https://github.com/v/svc", "https://github.com/v/api"]
+        # Distinct description lengths: no survivor is decided by position.
+        projects = [
+            pb.Project(name=rng.choice(names), description="d" * index, link=rng.choice(links), skills=[])
+            for index in range(40)
+        ]
+        expected = sorted(p.description for p in pb.deduplicate_projects(projects))
+        for _ in range(20):
+            rng.shuffle(projects)
+            self.assertEqual(sorted(p.description for p in pb.deduplicate_projects(projects)), expected)
 
 
 if __name__ == "__main__":